@@ -1,25 +1,54 @@
 """Liebherr HomeAPI for HomeAssistant."""
 
-from collections.abc import Callable
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final
 
-from pyliebherr import LiebherrAPI, LiebherrDevice
+from pyliebherr import ControlType, LiebherrAPI, LiebherrControlKey, LiebherrDevice
 from pyliebherr.exception import (
     LiebherrAuthException,
     LiebherrException,
-    LiebherrSSEException,
 )
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.translation import async_get_translations
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.ssl import client_context
 
-from .const import CONF_PRESENTATION_LIGHT_AS_NUMBER, DOMAIN, SSE_INITIAL_TIMEOUT
+from .const import (
+    AVAILABILITY_GRACE,
+    CONF_AVAILABILITY_GRACE,
+    CONF_PRESENTATION_LIGHT_AS_NUMBER,
+    CONF_PROGRESSIVE_SETUP,
+    DISCOVERY_INTERVAL,
+    DISCOVERY_REMOVE_AFTER,
+    DOMAIN,
+    PROGRESSIVE_SETUP_GRACE,
+    SIGNAL_DEVICE_READY,
+    SSE_INITIAL_TIMEOUT,
+)
+from .handoff import LiebherrHandoff, async_pop_handoff
+from .hub import LiebherrHub
+from .image_cache import LiebherrImageCache, LiebherrImageVariants
+from .reconnect import LiebherrReconnectScheduler
+from .scheduler import LiebherrRequestScheduler, RequestPriority
+from .storage import LiebherrSnapshotStore
+from .view import LiebherrImageView
+
+if TYPE_CHECKING:
+    from .image import LiebherrImage
+
+type LiebherrControlIndex = dict[
+    ControlType, list[tuple[LiebherrDevice, LiebherrControlKey]]
+]
 
 
 @dataclass
@@ -27,8 +56,19 @@ class LiebherrRuntimeData:
     """Holds the integration runtime data."""
 
     api: LiebherrAPI
+    scheduler: LiebherrRequestScheduler
+    hub: LiebherrHub
+    image_cache: LiebherrImageCache
+    image_variants: LiebherrImageVariants
+    reconnect: LiebherrReconnectScheduler
+    snapshot: LiebherrSnapshotStore
     devices: list[LiebherrDevice]
     translations: dict[str, str]
+    platforms: set[Platform] = field(default_factory=set)
+    controls: LiebherrControlIndex = field(default_factory=dict)
+    images: dict[str, "LiebherrImage"] = field(default_factory=dict)
+    # Consecutive device listings each device was missing from
+    missing: dict[str, int] = field(default_factory=dict)
 
 
 type LiebherrConfigEntry = ConfigEntry[LiebherrRuntimeData]
@@ -36,59 +76,148 @@ type LiebherrConfigEntry = ConfigEntry[LiebherrRuntimeData]
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = {
-    Platform.CLIMATE,
-    Platform.COVER,
-    Platform.FAN,
-    Platform.IMAGE,
-    Platform.SELECT,
-    Platform.SWITCH,
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Platforms forwarded for every entry, the others only if a control needs them
+PLATFORMS: Final[set[Platform]] = {Platform.IMAGE, Platform.SENSOR}
+
+CONTROL_PLATFORMS: Final[dict[ControlType, Platform]] = {
+    ControlType.AUTO_DOOR_CONTROL: Platform.COVER,
+    ControlType.BIO_FRESH_PLUS: Platform.SELECT,
+    ControlType.HYDRO_BREEZE: Platform.FAN,
+    ControlType.ICE_MAKER: Platform.SELECT,
+    ControlType.TEMPERATURE: Platform.CLIMATE,
+    ControlType.TOGGLE: Platform.SWITCH,
 }
 
 
-async def async_setup_entry(hass: HomeAssistant, config_entry: LiebherrConfigEntry):
-    """Set up Liebherr devices from a config entry."""
+def async_index_controls(devices: list[LiebherrDevice]) -> LiebherrControlIndex:
+    """Index the controls of the devices by type, so platforms read their slice."""
+    index: LiebherrControlIndex = {}
+    for device in devices:
+        if not device.controls:
+            _LOGGER.warning("No controls found for device %s", device.device_id)
+            continue
+        if device.device_type not in LiebherrDevice.DeviceType:
+            continue
+        for control_key, control in device.controls.items():
+            index.setdefault(control.type, []).append((device, control_key))
+    return index
+
+
+@callback
+def async_get_platforms(
+    config_entry: LiebherrConfigEntry, controls: LiebherrControlIndex
+) -> set[Platform]:
+    """The platforms needed for the indexed controls."""
+    platforms: set[Platform] = set(PLATFORMS)
+    for control_type in controls:
+        if control_type == ControlType.PRESENTATION_LIGHT:
+            platforms.add(
+                Platform.NUMBER
+                if config_entry.options.get(CONF_PRESENTATION_LIGHT_AS_NUMBER, False)
+                else Platform.LIGHT
+            )
+        elif platform := CONTROL_PLATFORMS.get(control_type):
+            platforms.add(platform)
+    return platforms
 
-    try:
-        api: LiebherrAPI = LiebherrAPI(
-            config_entry.data[CONF_API_KEY], ssl_context=client_context()
-        )
 
-        devices: list[LiebherrDevice] = await api.async_get_devices_wait_for_controls(
-            timeout=SSE_INITIAL_TIMEOUT
-        )
+@callback
+def async_create_api(hass: HomeAssistant, api_key: str) -> LiebherrAPI:
+    """Create an API client, the caller closes it with async_close.
 
-        def _get_device_error_callback(
-            device: LiebherrDevice,
-        ) -> Callable[[LiebherrSSEException], None]:
+    The client owns its session: pyliebherr==2026.7.1 is only known to take
+    an ssl_context, not an external session, so the shared session of HA is
+    not handed to it (and could be closed along with the client).
+    """
+    return LiebherrAPI(api_key, ssl_context=client_context())
 
-            sub_current_sse: Callable[[None], None] | None = None
 
-            def _device_error_callback(exc: LiebherrSSEException) -> None:
-                nonlocal sub_current_sse
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Liebherr integration."""
+    hass.http.register_view(LiebherrImageView())
+    return True
 
-                if device.reconnect_attempt < 10:
-                    delay: int = 30 * device.reconnect_attempt
-                    _LOGGER.info(
-                        "Retrying SSE connection to %s after %ds delay, attempt %d",
-                        device.device_id,
-                        delay,
-                        device.reconnect_attempt,
-                    )
-                    if sub_current_sse and callable(sub_current_sse):
-                        sub_current_sse()  # Cancel the current task
-                    sub_current_sse = api.start_sse(device, delay=delay)
-                else:
-                    raise ConfigEntryError(
-                        translation_domain=DOMAIN,
-                        translation_key="sse_error",
-                        translation_placeholders={"attempt": device.reconnect_attempt},
-                    )
 
-            return _device_error_callback
+async def async_setup_entry(hass: HomeAssistant, config_entry: LiebherrConfigEntry):
+    """Set up Liebherr devices from a config entry."""
+
+    handoff: LiebherrHandoff | None = async_pop_handoff(
+        hass, config_entry.data[CONF_API_KEY]
+    )
+    api: LiebherrAPI = (
+        handoff.api
+        if handoff
+        else async_create_api(hass, config_entry.data[CONF_API_KEY])
+    )
+    scheduler: LiebherrRequestScheduler = LiebherrRequestScheduler(hass)
+    hub: LiebherrHub = LiebherrHub(
+        hass,
+        api,
+        scheduler,
+        config_entry.options.get(CONF_AVAILABILITY_GRACE, AVAILABILITY_GRACE),
+    )
+    reconnect: LiebherrReconnectScheduler = LiebherrReconnectScheduler(
+        hass, config_entry, hub
+    )
+    snapshot: LiebherrSnapshotStore = LiebherrSnapshotStore(hass, config_entry)
 
-        for device in devices:
-            device.add_error_callback(_get_device_error_callback(device))
+    started: bool = False
+    try:
+        devices: list[LiebherrDevice] | None = await snapshot.async_load()
+        listed: list[LiebherrDevice] | None = None
+        if not devices and handoff:
+            # Reuse the device listing of the config flow
+            listed = await handoff.devices
+        progressive: bool = config_entry.options.get(CONF_PROGRESSIVE_SETUP, False)
+        if devices:
+            # Set up from the snapshot, entities go live as the streams report in
+            for device in devices:
+                hub.async_add_device(device, stale=True)
+                hub.availability[device.device_id].async_add_error_callback(
+                    reconnect.get_error_callback(device)
+                )
+                hub.async_start_stream(device)
+            if handoff:
+                # Validated by the config flow, the listing is not needed
+                handoff.devices.cancel()
+            else:
+                config_entry.async_create_background_task(
+                    hass,
+                    _async_validate_key(hass, config_entry, api, scheduler),
+                    "validate api key",
+                )
+        else:
+            # Start the streams, with progressive setup set up the devices that
+            # report in quickly and attach the rest later
+            if listed is None:
+                listed = await scheduler.async_run(
+                    RequestPriority.DISCOVERY, api.async_get_devices
+                )
+            for device in listed:
+                hub.async_add_device(device)
+                hub.availability[device.device_id].async_add_error_callback(
+                    reconnect.get_error_callback(device)
+                )
+                hub.async_start_stream(device)
+            ready: list[bool] = await asyncio.gather(
+                *(
+                    hub.async_wait_for_controls(
+                        device,
+                        PROGRESSIVE_SETUP_GRACE if progressive else SSE_INITIAL_TIMEOUT,
+                    )
+                    for device in hub.devices.values()
+                )
+            )
+            if not progressive and not all(ready):
+                raise TimeoutError
+            devices = [
+                device
+                for device, is_ready in zip(hub.devices.values(), ready, strict=True)
+                if is_ready
+            ]
+        started = True
 
     except TimeoutError as ex:
         raise ConfigEntryError(
@@ -101,26 +230,180 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: LiebherrConfigEnt
         raise ConfigEntryError(
             translation_key="config_entry", translation_placeholders={"msg": str(ex)}
         ) from ex
-
+    finally:
+        if not started:
+            # Stop the streams already started and close the client
+            if handoff:
+                handoff.devices.cancel()
+            await _async_shutdown(api, scheduler, hub, reconnect)
+
+    controls: LiebherrControlIndex = async_index_controls(devices)
     config_entry.runtime_data = LiebherrRuntimeData(
         api=api,
+        scheduler=scheduler,
+        hub=hub,
+        image_cache=LiebherrImageCache(hass),
+        image_variants=LiebherrImageVariants(),
+        reconnect=reconnect,
+        snapshot=snapshot,
         devices=devices,
+        platforms=async_get_platforms(config_entry, controls),
+        controls=controls,
         translations=await async_get_translations(
             hass, hass.config.language, "common", [DOMAIN]
         ),
     )
 
-    if config_entry.options.get(CONF_PRESENTATION_LIGHT_AS_NUMBER, False):
-        PLATFORMS.add(Platform.NUMBER)
-    else:
-        # Add Light to platforms
-        PLATFORMS.add(Platform.LIGHT)
+    snapshot.async_schedule_save(devices)
+    config_entry.async_on_unload(
+        hub.async_add_device_listener(
+            lambda _: snapshot.async_schedule_save(devices)
+        )
+    )
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(
+        config_entry, config_entry.runtime_data.platforms
+    )
+
+    for device in hub.devices.values():
+        if device not in devices:
+            _async_add_device_when_ready(hass, config_entry, device)
+
+    if hub.stale:
+        # The snapshot may be outdated, check for added and removed appliances
+        config_entry.async_create_background_task(
+            hass, _async_discover_devices(hass, config_entry), "liebherr discovery"
+        )
+
+    async def _async_refresh_devices(_: datetime) -> None:
+        await _async_discover_devices(hass, config_entry)
+
+    config_entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            _async_refresh_devices,
+            DISCOVERY_INTERVAL,
+            name="liebherr device discovery",
+            cancel_on_shutdown=True,
+        )
+    )
 
     return True
 
 
+async def _async_discover_devices(
+    hass: HomeAssistant, config_entry: LiebherrConfigEntry
+) -> None:
+    """Add appliances new to the account and remove the ones that are gone."""
+    runtime_data: LiebherrRuntimeData = config_entry.runtime_data
+    hub: LiebherrHub = runtime_data.hub
+    try:
+        listed: list[LiebherrDevice] = await runtime_data.scheduler.async_run(
+            RequestPriority.DISCOVERY, runtime_data.api.async_get_devices
+        )
+    except LiebherrException as ex:
+        _LOGGER.debug("Unable to refresh the device list: %s", ex)
+        return
+
+    for device in listed:
+        if device.device_id not in hub.devices:
+            _LOGGER.info("Discovered new appliance %s", device.device_id)
+            hub.async_add_device(device)
+            hub.availability[device.device_id].async_add_error_callback(
+                runtime_data.reconnect.get_error_callback(device)
+            )
+            hub.async_start_stream(device)
+            _async_add_device_when_ready(hass, config_entry, device)
+
+    listed_ids: set[str] = {device.device_id for device in listed}
+    for device_id in listed_ids:
+        runtime_data.missing.pop(device_id, None)
+    if not listed_ids:
+        # Never act on an empty listing, it is more likely a glitch of the cloud
+        _LOGGER.debug("The device list is empty, not removing any appliances")
+        return
+    device_registry: dr.DeviceRegistry = dr.async_get(hass)
+    for device_id in set(hub.devices) - listed_ids:
+        missing: int = runtime_data.missing.get(device_id, 0) + 1
+        if missing < DISCOVERY_REMOVE_AFTER:
+            runtime_data.missing[device_id] = missing
+            _LOGGER.debug(
+                "Appliance %s missing from %d device listings", device_id, missing
+            )
+            continue
+        del runtime_data.missing[device_id]
+        _LOGGER.info("Appliance %s was removed from the account", device_id)
+        hub.async_remove_device(device_id)
+        runtime_data.reconnect.async_remove_device(device_id)
+        runtime_data.devices[:] = [
+            device for device in runtime_data.devices if device.device_id != device_id
+        ]
+        for controls in runtime_data.controls.values():
+            controls[:] = [
+                (device, control_key)
+                for device, control_key in controls
+                if device.device_id != device_id
+            ]
+        if device_entry := device_registry.async_get_device(
+            identifiers={(DOMAIN, device_id)}
+        ):
+            device_registry.async_update_device(
+                device_entry.id, remove_config_entry_id=config_entry.entry_id
+            )
+    runtime_data.snapshot.async_schedule_save(runtime_data.devices)
+
+
+@callback
+def _async_add_device_when_ready(
+    hass: HomeAssistant, config_entry: LiebherrConfigEntry, device: LiebherrDevice
+) -> None:
+    """Attach a device to the platforms once its controls arrived."""
+
+    async def _async_wait_for_controls() -> None:
+        if not await config_entry.runtime_data.hub.async_wait_for_controls(device):
+            return
+        runtime_data: LiebherrRuntimeData = config_entry.runtime_data
+        runtime_data.devices.append(device)
+        controls: LiebherrControlIndex = async_index_controls([device])
+        if platforms := async_get_platforms(config_entry, controls) - (
+            runtime_data.platforms
+        ):
+            # First device with these controls, the platforms add its entities
+            # once the device is indexed and announced
+            async with config_entry.setup_lock:
+                platforms -= runtime_data.platforms
+                runtime_data.platforms |= platforms
+                await hass.config_entries.async_forward_entry_setups(
+                    config_entry, platforms
+                )
+        for control_type, device_controls in controls.items():
+            runtime_data.controls.setdefault(control_type, []).extend(device_controls)
+        async_dispatcher_send(
+            hass, SIGNAL_DEVICE_READY.format(config_entry.entry_id), device, controls
+        )
+
+    _LOGGER.info("Waiting for %s to report its controls", device.device_id)
+    config_entry.async_create_background_task(
+        hass, _async_wait_for_controls(), f"{device.device_id} wait for controls"
+    )
+
+
+async def _async_validate_key(
+    hass: HomeAssistant,
+    config_entry: LiebherrConfigEntry,
+    api: LiebherrAPI,
+    scheduler: LiebherrRequestScheduler,
+) -> None:
+    """Validate the API key when set up from the snapshot (without the API)."""
+    try:
+        await scheduler.async_run(RequestPriority.DISCOVERY, api.async_test_key)
+    except LiebherrAuthException:
+        _LOGGER.error("Invalid API key, need to reauth")
+        config_entry.async_start_reauth(hass)
+    except LiebherrException as ex:
+        _LOGGER.debug("Unable to validate API key: %s", ex)
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: LiebherrConfigEntry):
     """Migrate old entry to newer version."""
 
@@ -150,10 +433,32 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: LiebherrConfigE
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: LiebherrConfigEntry):
     """Unload a config entry."""
-    await config_entry.runtime_data.api.async_close()
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    runtime_data: LiebherrRuntimeData = config_entry.runtime_data
+    await _async_shutdown(
+        runtime_data.api,
+        runtime_data.scheduler,
+        runtime_data.hub,
+        runtime_data.reconnect,
+    )
+    return await hass.config_entries.async_unload_platforms(
+        config_entry, config_entry.runtime_data.platforms
+    )
+
+
+async def _async_shutdown(
+    api: LiebherrAPI,
+    scheduler: LiebherrRequestScheduler,
+    hub: LiebherrHub,
+    reconnect: LiebherrReconnectScheduler,
+) -> None:
+    """Stop the streams, reconnects and queued requests, then close the client."""
+    reconnect.async_shutdown()
+    hub.async_shutdown()
+    scheduler.async_shutdown()
+    await api.async_close()
 
 
 async def async_remove_entry(hass: HomeAssistant, config_entry: LiebherrConfigEntry):
     """Remove a config entry."""
+    await LiebherrSnapshotStore(hass, config_entry).async_remove()
     return True
@@ -0,0 +1,127 @@
+"""Availability tracking for Liebherr appliances."""
+
+from collections.abc import Callable
+from datetime import datetime
+import logging
+from typing import Any
+
+from pyliebherr import LiebherrDevice
+from pyliebherr.exception import LiebherrSSEException
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .writer import LiebherrStateWriter, LiebherrWritableEntity
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class LiebherrAvailabilityTracker:
+    """Owns the SSE error callback of a device and the availability of its entities.
+
+    A dropped stream only marks the entities unavailable if the device did not
+    recover within the grace period, so transient drops do not flap every
+    entity. Availability changes are written for all entities in one batch.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: LiebherrDevice,
+        writer: LiebherrStateWriter,
+        grace: float,
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass: HomeAssistant = hass
+        self.device: LiebherrDevice = device
+        self.writer: LiebherrStateWriter = writer
+        self.grace: float = grace
+        self.available: bool = True
+        self.drops: int = 0
+        self.outages: int = 0
+        self._entities: dict[LiebherrWritableEntity, None] = {}
+        self._error_callbacks: list[Callable[[LiebherrSSEException], None]] = []
+        self._cancel_grace: CALLBACK_TYPE | None = None
+        self._shutdown: bool = False
+        device.add_error_callback(self._async_handle_error)
+
+    @callback
+    def async_add_entity(self, entity: LiebherrWritableEntity) -> CALLBACK_TYPE:
+        """Track an entity of the device, returns a function to stop tracking."""
+        self._entities[entity] = None
+
+        @callback
+        def _remove_entity() -> None:
+            self._entities.pop(entity, None)
+
+        return _remove_entity
+
+    @callback
+    def async_add_error_callback(
+        self, error_callback: Callable[[LiebherrSSEException], None]
+    ) -> None:
+        """Forward the SSE errors of the device (i.e. to schedule a reconnect)."""
+        self._error_callbacks.append(error_callback)
+
+    @callback
+    def _async_handle_error(self, exc: LiebherrSSEException) -> None:
+        """Start the grace period, the entities stay available for now."""
+        if self._shutdown:
+            # The callback cannot be removed from the device, ignore it instead
+            return
+        self.drops += 1
+        if self.available and self._cancel_grace is None:
+            self._cancel_grace = async_call_later(
+                self.hass, self.grace, self._async_grace_expired
+            )
+        for error_callback in list(self._error_callbacks):
+            error_callback(exc)
+
+    @callback
+    def _async_grace_expired(self, _: datetime) -> None:
+        self._cancel_grace = None
+        if self.device.available:
+            return
+        _LOGGER.info(
+            "%s did not reconnect within %.0fs, marking it unavailable",
+            self.device.device_id,
+            self.grace,
+        )
+        self.outages += 1
+        self.available = False
+        self._async_write_all()
+
+    @callback
+    def async_update(self) -> None:
+        """The device reported in (or reconnected), restore its availability."""
+        if not self.device.available:
+            return
+        if self._cancel_grace:
+            self._cancel_grace()
+            self._cancel_grace = None
+        if not self.available:
+            self.available = True
+            self._async_write_all()
+
+    @callback
+    def _async_write_all(self) -> None:
+        for entity in self._entities:
+            self.writer.async_schedule_write(entity)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a pending grace period and detach from the device."""
+        self._shutdown = True
+        self._error_callbacks.clear()
+        if self._cancel_grace:
+            self._cancel_grace()
+            self._cancel_grace = None
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Availability accounting for diagnostics."""
+        return {
+            "available": self.available,
+            "drops": self.drops,
+            "outages": self.outages,
+        }
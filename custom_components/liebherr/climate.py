@@ -1,5 +1,9 @@
 """Support for Liebherr appliances as climate devices."""
 
+from datetime import datetime
+import time
+from typing import TYPE_CHECKING
+
 from pyliebherr import ControlType, LiebherrControlKey, LiebherrDevice
 from pyliebherr.const import ZonePosition
 from pyliebherr.models import TemperatureControlRequest
@@ -10,12 +14,23 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later, async_track_utc_time_change
+from homeassistant.util import slugify
 
 from . import LiebherrConfigEntry
+from .const import (
+    CONF_EXTERNAL_STATISTICS,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_MIN_INTERVAL,
+    DOMAIN,
+)
 from .entity import LiebherrEntity, base_async_setup_entry
 
+if TYPE_CHECKING:
+    from .statistics import LiebherrHourlyStatistics
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,6 +47,8 @@ async def async_setup_entry(
 class LiebherrClimate(LiebherrEntity, ClimateEntity):
     """Representation of a Liebherr climate entity."""
 
+    _unrecorded_attributes = frozenset({"enabled_temperature_steps"})
+
     def __init__(
         self,
         config_entry: LiebherrConfigEntry,
@@ -40,6 +57,18 @@ class LiebherrClimate(LiebherrEntity, ClimateEntity):
     ) -> None:
         """Initialize the climate entity."""
         super().__init__(config_entry, device, control_key)
+        self.deadband: float = config_entry.options.get(CONF_TEMPERATURE_DEADBAND, 0)
+        self.min_interval: float = config_entry.options.get(
+            CONF_TEMPERATURE_MIN_INTERVAL, 0
+        )
+        self._published_temperature: float | None = self._device_temperature()
+        self._published_target: float | None = self.control.target
+        self._published_at: float = time.monotonic()
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self.external_statistics: bool = config_entry.options.get(
+            CONF_EXTERNAL_STATISTICS, False
+        )
+        self.statistics: "LiebherrHourlyStatistics | None" = None
         self._attr_target_temperature_step = 1
         self._attr_temperature_unit = self.control.unit_of_measurement or "°C"
         self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
@@ -105,9 +134,7 @@ class LiebherrClimate(LiebherrEntity, ClimateEntity):
                 unit=self._attr_temperature_unit,
             )
 
-            await self.async_set_value(data)
-            self.control.target = temperature
-            self.async_write_ha_state()
+            await self.async_set_optimistic(data, target=temperature)
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set the HVAC mode."""
@@ -131,5 +158,101 @@ class LiebherrClimate(LiebherrEntity, ClimateEntity):
 
     @property
     def current_temperature(self) -> float | None:
-        """Current Temp."""
+        """Current Temp (as last published, see _async_publish_temperature)."""
+        return self._published_temperature
+
+    def _device_temperature(self) -> float | None:
         return self.control.value if isinstance(self.control.value, int) else None
+
+    async def async_added_to_hass(self) -> None:
+        """Start the hourly statistics of the zone if enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_flush)
+        if not self.external_statistics:
+            return
+        # Imports the recorder, only when the option is enabled
+        from .statistics import LiebherrHourlyStatistics  # noqa: PLC0415
+
+        zone: str = f"_{self.control.zone_id}" if self.control.zone_id else ""
+        self.statistics = LiebherrHourlyStatistics(
+            self.hass,
+            f"{DOMAIN}:{slugify(self.device.device_id)}"
+            f"_{slugify(self.control.control_name)}{zone}",
+            f"{self.device.name or self.device.device_id}"
+            f" {self.control.zone_position or self.control.control_name}"
+            " temperature",
+            self._attr_temperature_unit,
+        )
+        self.statistics.async_add_value(self._device_temperature())
+        self.async_on_remove(
+            async_track_utc_time_change(
+                self.hass, self.statistics.async_close_hour, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_handle_control_update(self) -> None:
+        """Filter the current temperature before the write is scheduled."""
+        if self.statistics:
+            self.statistics.async_add_value(self._device_temperature())
+        self._async_publish_temperature()
+        super()._async_handle_control_update()
+
+    @callback
+    def _async_publish_temperature(self) -> None:
+        """Publish the current temperature unless the change is jitter.
+
+        Published right away: changes of at least the deadband (measured from
+        the published temperature), crossings of the target temperature,
+        changes to or from unknown and target changes. Smaller changes are
+        held back, and with a minimum interval the latest of them is
+        published once the interval passed, even if the device goes quiet.
+        """
+        target_changed: bool = self.control.target != self._published_target
+        self._published_target = self.control.target
+        temperature: float | None = self._device_temperature()
+        if temperature == self._published_temperature:
+            self._async_cancel_flush()
+            return
+        now: float = time.monotonic()
+        if (
+            temperature is None
+            or self._published_temperature is None
+            or abs(temperature - self._published_temperature) >= self.deadband
+            or target_changed
+            or self._crossed_target(temperature)
+            or (self.min_interval and now - self._published_at >= self.min_interval)
+        ):
+            self._async_cancel_flush()
+            self._published_temperature = temperature
+            self._published_at = now
+        elif self.min_interval and self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self.hass,
+                self.min_interval - (now - self._published_at),
+                self._async_flush,
+            )
+
+    def _crossed_target(self, temperature: float) -> bool:
+        """Whether the temperature moved to the other side of the target."""
+        if self.control.target is None or self._published_temperature is None:
+            return False
+        return (temperature > self.control.target) != (
+            self._published_temperature > self.control.target
+        )
+
+    @callback
+    def _async_flush(self, _: datetime) -> None:
+        """Publish the change held back for the minimum interval."""
+        self._cancel_flush = None
+        if (temperature := self._device_temperature()) == self._published_temperature:
+            return
+        self._published_temperature = temperature
+        self._published_at = time.monotonic()
+        self.hub.writers[self.device.device_id].async_schedule_write(self)
+
+    @callback
+    def _async_cancel_flush(self) -> None:
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
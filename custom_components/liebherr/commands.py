@@ -0,0 +1,144 @@
+"""Command pipeline for Liebherr appliances."""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any
+
+from pyliebherr import LiebherrAPI, LiebherrControlKey, LiebherrControlRequest
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import COMMAND_DEBOUNCE, COMMAND_LATENCY_SAMPLES
+from .scheduler import LiebherrRequestScheduler, RequestPriority
+from .trace import LiebherrTrace, LiebherrTraceEntry
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingCommand:
+    """The latest request for a control, shared by every superseded caller."""
+
+    request: LiebherrControlRequest
+    future: asyncio.Future[list[dict[str, Any]]]
+    handle: asyncio.TimerHandle | None = None
+    callers: int = field(default=1)
+
+
+class LiebherrCommandQueue:
+    """Debounces, coalesces and serializes the commands of a device.
+
+    Requests for the same control within COMMAND_DEBOUNCE seconds collapse to
+    the latest one and every caller awaits the result of that single call.
+    Calls are sent one at a time, in order, per device.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: LiebherrAPI,
+        scheduler: LiebherrRequestScheduler,
+        device_id: str,
+        trace: LiebherrTrace,
+        debounce: float = COMMAND_DEBOUNCE,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass: HomeAssistant = hass
+        self.api: LiebherrAPI = api
+        self.scheduler: LiebherrRequestScheduler = scheduler
+        self.device_id: str = device_id
+        self.trace: LiebherrTrace = trace
+        self.debounce: float = debounce
+        self.sent: int = 0
+        self.coalesced: int = 0
+        self.latencies: deque[float] = deque(maxlen=COMMAND_LATENCY_SAMPLES)
+        self._pending: dict[LiebherrControlKey, _PendingCommand] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @property
+    def depth(self) -> int:
+        """Number of commands waiting to be sent."""
+        return len(self._pending)
+
+    async def async_send(
+        self, control_key: LiebherrControlKey, request: LiebherrControlRequest
+    ) -> list[dict[str, Any]]:
+        """Queue a request, superseding a pending request for the same control."""
+        if pending := self._pending.get(control_key):
+            pending.request = request
+            pending.callers += 1
+            self.coalesced += 1
+            if pending.handle:
+                pending.handle.cancel()
+        else:
+            pending = _PendingCommand(request, self.hass.loop.create_future())
+            self._pending[control_key] = pending
+        pending.handle = self.hass.loop.call_later(
+            self.debounce, self._async_flush, control_key
+        )
+        return await asyncio.shield(pending.future)
+
+    @callback
+    def _async_flush(self, control_key: LiebherrControlKey) -> None:
+        """Debounce elapsed, send the latest request."""
+        pending: _PendingCommand = self._pending.pop(control_key)
+        self.hass.async_create_task(
+            self._async_send(control_key, pending), f"{self.device_id} command"
+        )
+
+    async def _async_send(
+        self, control_key: LiebherrControlKey, pending: _PendingCommand
+    ) -> None:
+        queued: float = time.monotonic()
+        async with self._lock:
+            if pending.future.done():
+                return
+            _LOGGER.debug(
+                "Sending %s to %s (%d callers)",
+                pending.request,
+                self.device_id,
+                pending.callers,
+            )
+            entry: LiebherrTraceEntry = self.trace.async_add_command(
+                control_key, pending.callers
+            )
+            try:
+                result: list[dict[str, Any]] = await self.scheduler.async_run(
+                    RequestPriority.COMMAND,
+                    lambda: self._async_set_value(pending.request, entry, queued),
+                )
+            except Exception as ex:  # noqa: BLE001
+                pending.future.set_exception(ex)
+            else:
+                pending.future.set_result(result)
+            finally:
+                self.sent += 1
+
+    async def _async_set_value(
+        self, request: LiebherrControlRequest, entry: LiebherrTraceEntry, queued: float
+    ) -> list[dict[str, Any]]:
+        """Call the API, recording the round trip time."""
+        start: float = time.monotonic()
+        try:
+            result: list[dict[str, Any]] = await self.api.async_set_value(
+                self.device_id, request
+            )
+        except Exception as ex:
+            self.trace.async_sent(entry, queued, start, ex)
+            raise
+        finally:
+            self.latencies.append(time.monotonic() - start)
+        self.trace.async_sent(entry, queued, start)
+        return result
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the commands not sent yet."""
+        for pending in self._pending.values():
+            if pending.handle:
+                pending.handle.cancel()
+            pending.future.cancel()
+        self._pending.clear()
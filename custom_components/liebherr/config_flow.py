@@ -18,20 +18,36 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_API_KEY
 from homeassistant.core import callback
-from homeassistant.data_entry_flow import section
-from homeassistant.helpers.selector import BooleanSelector, TextSelector
+from homeassistant.data_entry_flow import AbortFlow, section
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    TextSelector,
+)
 
-from . import LiebherrConfigEntry
+from . import LiebherrConfigEntry, async_create_api
 from .const import (
+    AVAILABILITY_GRACE,
+    CONF_AVAILABILITY_GRACE,
+    CONF_EXTERNAL_STATISTICS,
     CONF_PRESENTATION_LIGHT_AS_NUMBER,
+    CONF_PROGRESSIVE_SETUP,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_MIN_INTERVAL,
     DOMAIN,
     URL_CONNECT_INSTRUCTIONS,
     URL_DOWNLOAD_APP,
 )
+from .handoff import async_store_handoff
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 LIGHT_SECTION: str = "presentation_light_options"
+SETUP_SECTION: str = "setup_options"
+CONNECTION_SECTION: str = "connection_options"
+CLIMATE_SECTION: str = "climate_options"
 
 
 class OptionsFlowHandler(OptionsFlowWithReload):
@@ -48,6 +64,21 @@ class OptionsFlowHandler(OptionsFlowWithReload):
                     CONF_PRESENTATION_LIGHT_AS_NUMBER: user_input[LIGHT_SECTION][
                         CONF_PRESENTATION_LIGHT_AS_NUMBER
                     ],
+                    CONF_PROGRESSIVE_SETUP: user_input[SETUP_SECTION][
+                        CONF_PROGRESSIVE_SETUP
+                    ],
+                    CONF_AVAILABILITY_GRACE: int(
+                        user_input[CONNECTION_SECTION][CONF_AVAILABILITY_GRACE]
+                    ),
+                    CONF_TEMPERATURE_DEADBAND: user_input[CLIMATE_SECTION][
+                        CONF_TEMPERATURE_DEADBAND
+                    ],
+                    CONF_TEMPERATURE_MIN_INTERVAL: int(
+                        user_input[CLIMATE_SECTION][CONF_TEMPERATURE_MIN_INTERVAL]
+                    ),
+                    CONF_EXTERNAL_STATISTICS: user_input[CLIMATE_SECTION][
+                        CONF_EXTERNAL_STATISTICS
+                    ],
                 }
             )
         suggested_values = {
@@ -56,6 +87,27 @@ class OptionsFlowHandler(OptionsFlowWithReload):
                     CONF_PRESENTATION_LIGHT_AS_NUMBER, False
                 ),
             },
+            SETUP_SECTION: {
+                CONF_PROGRESSIVE_SETUP: self.config_entry.options.get(
+                    CONF_PROGRESSIVE_SETUP, False
+                ),
+            },
+            CONNECTION_SECTION: {
+                CONF_AVAILABILITY_GRACE: self.config_entry.options.get(
+                    CONF_AVAILABILITY_GRACE, AVAILABILITY_GRACE
+                ),
+            },
+            CLIMATE_SECTION: {
+                CONF_TEMPERATURE_DEADBAND: self.config_entry.options.get(
+                    CONF_TEMPERATURE_DEADBAND, 0
+                ),
+                CONF_TEMPERATURE_MIN_INTERVAL: self.config_entry.options.get(
+                    CONF_TEMPERATURE_MIN_INTERVAL, 0
+                ),
+                CONF_EXTERNAL_STATISTICS: self.config_entry.options.get(
+                    CONF_EXTERNAL_STATISTICS, False
+                ),
+            },
         }
         OPTIONS_SCHEMA: vol.Schema = vol.Schema(
             {
@@ -68,6 +120,54 @@ class OptionsFlowHandler(OptionsFlowWithReload):
                         }
                     )
                 ),
+                vol.Required(SETUP_SECTION): section(
+                    vol.Schema(
+                        {
+                            vol.Required(CONF_PROGRESSIVE_SETUP): BooleanSelector(),
+                        }
+                    )
+                ),
+                vol.Required(CONNECTION_SECTION): section(
+                    vol.Schema(
+                        {
+                            vol.Required(CONF_AVAILABILITY_GRACE): NumberSelector(
+                                NumberSelectorConfig(
+                                    min=0,
+                                    max=900,
+                                    step=1,
+                                    unit_of_measurement="s",
+                                    mode=NumberSelectorMode.BOX,
+                                )
+                            ),
+                        }
+                    )
+                ),
+                vol.Required(CLIMATE_SECTION): section(
+                    vol.Schema(
+                        {
+                            vol.Required(CONF_TEMPERATURE_DEADBAND): NumberSelector(
+                                NumberSelectorConfig(
+                                    min=0,
+                                    max=5,
+                                    step=0.5,
+                                    mode=NumberSelectorMode.BOX,
+                                )
+                            ),
+                            vol.Required(
+                                CONF_TEMPERATURE_MIN_INTERVAL
+                            ): NumberSelector(
+                                NumberSelectorConfig(
+                                    min=0,
+                                    max=3600,
+                                    step=1,
+                                    unit_of_measurement="s",
+                                    mode=NumberSelectorMode.BOX,
+                                )
+                            ),
+                            vol.Required(CONF_EXTERNAL_STATISTICS): BooleanSelector(),
+                        }
+                    )
+                ),
             }
         )
         return self.async_show_form(
@@ -97,17 +197,28 @@ class LiebherrConfigFlow(ConfigFlow, domain=DOMAIN):
             if not re.fullmatch("^\\S.*\\S$", user_input[CONF_API_KEY]):
                 errors[CONF_API_KEY] = "whitespace_api_key"
             else:
+                api: LiebherrAPI = async_create_api(
+                    self.hass, user_input[CONF_API_KEY]
+                )
+                validated: bool = False
                 try:
-                    api: LiebherrAPI = LiebherrAPI(user_input[CONF_API_KEY])
                     await api.async_test_key()
+                    validated = True
                 except LiebherrAuthException:
                     errors["base"] = "auth_error"
                 finally:
-                    if hasattr(self, "api"):
+                    if not validated:
                         await api.async_close()
             if not errors:
                 await self.async_set_unique_id(f"{DOMAIN}_{user_input[CONF_API_KEY]}")
-                self._abort_if_unique_id_configured()
+                try:
+                    self._abort_if_unique_id_configured()
+                except AbortFlow:
+                    await api.async_close()
+                    raise
+                if self.source in (SOURCE_USER, SOURCE_REAUTH):
+                    # Hand the validated client over to the setup that follows
+                    async_store_handoff(self.hass, user_input[CONF_API_KEY], api)
                 if self.source == SOURCE_USER:
                     return self.async_create_entry(
                         title="Liebherr SmartDevice",
@@ -126,6 +237,7 @@ class LiebherrConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.error(
                     "An invalid config flow source was specified: %s", self.source
                 )
+                await api.async_close()
                 return self.async_abort(reason="invalid_source")
 
         data_schema: vol.Schema = vol.Schema(
@@ -1,5 +1,6 @@
 """Constants for the Liebherr integration."""
 
+from datetime import timedelta
 from typing import Final
 
 DOMAIN = "liebherr"
@@ -11,5 +12,52 @@ URL_CONNECT_INSTRUCTIONS: Final[str] = (
     "lhbu-hau/documents/smartdevicebox-network-imodels-en.pdf"
 )
 CONF_PRESENTATION_LIGHT_AS_NUMBER: Final[str] = "presentation_light_as_number"
+CONF_PROGRESSIVE_SETUP: Final[str] = "progressive_setup"
+CONF_AVAILABILITY_GRACE: Final[str] = "availability_grace"
+CONF_TEMPERATURE_DEADBAND: Final[str] = "temperature_deadband"
+CONF_TEMPERATURE_MIN_INTERVAL: Final[str] = "temperature_min_interval"
+CONF_EXTERNAL_STATISTICS: Final[str] = "external_statistics"
 
 SSE_INITIAL_TIMEOUT: Final[int] = 60  # seconds
+PROGRESSIVE_SETUP_GRACE: Final[int] = 10  # seconds
+CONTROLS_POLL_INTERVAL: Final[float] = 0.5  # seconds
+DISCOVERY_INTERVAL: Final[timedelta] = timedelta(hours=1)
+DISCOVERY_REMOVE_AFTER: Final[int] = 3  # consecutive listings missing a device
+HANDOFF_TTL: Final[int] = 60  # seconds
+
+SIGNAL_DEVICE_READY: Final[str] = f"{DOMAIN}_device_ready_{{}}"
+
+RECONNECT_BASE_DELAY: Final[int] = 15  # seconds
+RECONNECT_MAX_DELAY: Final[int] = 900  # seconds
+RECONNECT_MAX_CONCURRENT: Final[int] = 3
+RECONNECT_CONNECT_TIMEOUT: Final[int] = 30  # seconds
+RECONNECT_STABLE_AFTER: Final[int] = 300  # seconds
+RECONNECT_WARN_ATTEMPTS: Final[int] = 10
+AVAILABILITY_GRACE: Final[int] = 60  # seconds
+
+STORAGE_VERSION: Final[int] = 1
+SNAPSHOT_SAVE_DELAY: Final[int] = 60  # seconds
+
+COMMAND_DEBOUNCE: Final[float] = 0.3  # seconds
+OPTIMISTIC_TIMEOUT: Final[int] = 15  # seconds
+COMMAND_LATENCY_SAMPLES: Final[int] = 100
+
+DOOR_TRANSITION_TIME: Final[int] = 10  # seconds, until a transition was observed
+DOOR_TRANSITION_MAX: Final[int] = 60  # seconds, longer transitions are ignored
+DOOR_TRANSITION_SAMPLES: Final[int] = 5
+
+METRICS_INTERVAL: Final[timedelta] = timedelta(minutes=1)
+METRICS_SIGNIFICANT_CHANGE: Final[float] = 0.2  # relative change of a metric
+METRICS_LAST_EVENT_RESOLUTION: Final[timedelta] = timedelta(minutes=15)
+TRACE_SIZE: Final[int] = 200  # entries per device
+
+REQUEST_RATE: Final[float] = 2.0  # requests per second
+REQUEST_BURST: Final[int] = 10
+REQUEST_THROTTLE_BACKOFF: Final[int] = 60  # seconds, without Retry-After
+
+IMAGE_FETCH_TIMEOUT: Final[int] = 10  # seconds
+IMAGE_CACHE_MAX_BYTES: Final[int] = 20 * 1024 * 1024
+IMAGE_VARIANT_CACHE_BYTES: Final[int] = 4 * 1024 * 1024
+IMAGE_VARIANT_WIDTHS: Final[tuple[int, ...]] = (64, 128, 256, 512)
+IMAGE_PICTURE_WIDTH: Final[int] = 256
+IMAGE_PREFETCH_CONCURRENCY: Final[int] = 2
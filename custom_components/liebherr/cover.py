@@ -1,7 +1,12 @@
 """Support for Liebherr autodoor devices with debounce logic."""
 
+from collections import deque
+from datetime import datetime
 from enum import StrEnum
 import logging
+from statistics import median
+import time
+from typing import Any
 
 from pyliebherr import LiebherrControlKey, LiebherrDevice
 from pyliebherr.const import ControlType
@@ -12,9 +17,12 @@ from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.dt import utcnow
 
 from . import LiebherrConfigEntry
+from .const import DOOR_TRANSITION_MAX, DOOR_TRANSITION_SAMPLES, DOOR_TRANSITION_TIME
 from .entity import LiebherrEntity, base_async_setup_entry
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,6 +52,8 @@ async def async_setup_entry(
 class LiebherrCover(LiebherrEntity, CoverEntity):
     """Representation of a Liebherr auto door cover with debounce."""
 
+    _unrecorded_attributes = frozenset({"transition_time"})
+
     def __init__(
         self,
         config_entry: LiebherrConfigEntry,
@@ -58,12 +68,37 @@ class LiebherrCover(LiebherrEntity, CoverEntity):
             CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
         )
         self._attr_icon = "mdi:door"
-        self._last_state_closed: bool = self.control.value == DoorState.CLOSED
+        # Local door state machine, the cloud only reports MOVING in between
+        self._door: DoorState = (
+            DoorState.CLOSED
+            if self.control.value == DoorState.CLOSED
+            else DoorState.OPEN
+        )
+        self._moving_to: DoorState | None = None
+        self._motion_started: float | None = None
+        self._transitions: deque[float] = deque(maxlen=DOOR_TRANSITION_SAMPLES)
+        self._cancel_projection: CALLBACK_TYPE | None = None
+        # When the end state was projected, until the cloud confirms it
+        self._projected_at: float | None = None
+        self._opened_at: datetime | None = (
+            utcnow() if self._door == DoorState.OPEN else None
+        )
+        self._last_open_duration: int | None = None
         # Defaults to true!?
         self._cover_is_last_toggle_direction_open = (
             self.control.value != DoorState.CLOSED
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Pick up a door that is moving already."""
+        await super().async_added_to_hass()
+        self._async_update_door()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending projection."""
+        await super().async_will_remove_from_hass()
+        self._async_stop_motion()
+
     @callback
     def _async_write_ha_state(self) -> None:
         """Override for debugging logging only."""
@@ -77,23 +112,139 @@ class LiebherrCover(LiebherrEntity, CoverEntity):
         )
         super()._async_write_ha_state()
 
+    @callback
+    def _async_handle_control_update(self) -> None:
+        """Advance the door state machine once per update."""
+        super()._async_handle_control_update()
+        self._async_update_door()
+
+    @callback
+    def _async_rollback(self) -> None:
+        """Abandon the local motion along with the optimistic value."""
+        self._async_stop_motion()
+        value: str | None = self._confirmed.get("value")
+        if value in (DoorState.OPEN, DoorState.CLOSED):
+            self._door = DoorState(value)
+        super()._async_rollback()
+
+    @property
+    def transition_time(self) -> float:
+        """Estimated time (seconds) the door takes to open or close."""
+        if not self._transitions:
+            return DOOR_TRANSITION_TIME
+        return median(self._transitions)
+
+    @callback
+    def _async_update_door(self) -> None:
+        """Apply the reported door state to the state machine."""
+        value: str | None = self.control.value
+        if value == DoorState.MOVING:
+            if self._moving_to is None and not self._projected_recently():
+                self._async_start_motion(
+                    DoorState.CLOSED if self._door == DoorState.OPEN else DoorState.OPEN
+                )
+            return
+        if value not in (DoorState.OPEN, DoorState.CLOSED):
+            return
+        if (
+            self._motion_started is not None
+            and (self._moving_to or self._door) == value
+        ):
+            # The event confirming a (projected) transition
+            duration: float = time.monotonic() - self._motion_started
+            if duration <= DOOR_TRANSITION_MAX:
+                self._transitions.append(duration)
+        self._async_stop_motion()
+        self._projected_at = None
+        self._async_set_door(DoorState(value))
+
+    def _projected_recently(self) -> bool:
+        """Whether a MOVING report is likely the late echo of a projected motion."""
+        return (
+            self._projected_at is not None
+            and time.monotonic() - self._projected_at < self.transition_time
+        )
+
+    @callback
+    def _async_start_motion(self, moving_to: DoorState) -> None:
+        """Start moving, projecting the end state after the transition time."""
+        self._async_stop_motion()
+        self._moving_to = moving_to
+        self._motion_started = time.monotonic()
+        self._cover_is_last_toggle_direction_open = moving_to == DoorState.OPEN
+        self._cancel_projection = async_call_later(
+            self.hass, self.transition_time, self._async_project_end_state
+        )
+
+    @callback
+    def _async_stop_motion(self) -> None:
+        self._moving_to = None
+        self._motion_started = None
+        if self._cancel_projection:
+            self._cancel_projection()
+            self._cancel_projection = None
+
+    @callback
+    def _async_project_end_state(self, _: datetime) -> None:
+        """The door should have arrived, show the end state without the cloud."""
+        self._cancel_projection = None
+        if self._moving_to is None:
+            return
+        _LOGGER.debug(
+            "Projecting door of %s zone %s %s after %.1fs",
+            self.device.device_id,
+            self.control.zone_id,
+            self._moving_to,
+            self.transition_time,
+        )
+        self._async_set_door(self._moving_to)
+        # Keep the start to learn from the event confirming the end state
+        self._moving_to = None
+        self._projected_at = time.monotonic()
+        if self._optimistic:
+            # The projection supersedes the optimistic MOVING, so it must not
+            # be rolled back when OPTIMISTIC_TIMEOUT passes
+            self._async_clear_optimistic()
+            self._set_control_values({"value": self._door})
+        self.hub.writers[self.device.device_id].async_schedule_write(self)
+
+    @callback
+    def _async_set_door(self, door: DoorState) -> None:
+        """Track how long the door is open."""
+        if door == self._door:
+            return
+        self._door = door
+        if door == DoorState.OPEN:
+            self._opened_at = utcnow()
+        elif self._opened_at is not None:
+            self._last_open_duration = round(
+                (utcnow() - self._opened_at).total_seconds()
+            )
+            self._opened_at = None
+
     @property
     def is_closed(self) -> bool:
         """Is closed."""
-        if self.control.value in (DoorState.OPEN, DoorState.CLOSED):
-            # Change only if the door isn't moving
-            self._last_state_closed = self.control.value == DoorState.CLOSED
-        return self.control.value == DoorState.CLOSED
+        return self._door == DoorState.CLOSED
 
     @property
     def is_opening(self) -> bool:
         """Is opening."""
-        return self.control.value == DoorState.MOVING and self._last_state_closed
+        return self._moving_to == DoorState.OPEN
 
     @property
     def is_closing(self) -> bool:
         """Is Closing."""
-        return self.control.value == DoorState.MOVING and (not self._last_state_closed)
+        return self._moving_to == DoorState.CLOSED
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Door timing."""
+        return {
+            "open_since": self._opened_at,
+            "last_open_duration": self._last_open_duration,
+            "transition_time": round(self.transition_time, 1),
+        }
 
     async def async_open_cover(self, **kwargs):
         """Send command to open the cover."""
@@ -102,11 +253,11 @@ class LiebherrCover(LiebherrEntity, CoverEntity):
             self.device.device_id,
             self.control.zone_id,
         )
-        await self.async_set_value(
+        self._async_start_motion(DoorState.OPEN)
+        await self.async_set_optimistic(
             AutoDoorControlRequest(zoneId=self.control.zone_id, value=True),
+            value=DoorState.MOVING,
         )
-        self.control.value = DoorState.MOVING
-        self.async_write_ha_state()
 
     async def async_close_cover(self, **kwargs):
         """Send command to close the cover."""
@@ -115,8 +266,8 @@ class LiebherrCover(LiebherrEntity, CoverEntity):
             self.device.device_id,
             self.control.zone_id,
         )
-        await self.async_set_value(
+        self._async_start_motion(DoorState.CLOSED)
+        await self.async_set_optimistic(
             AutoDoorControlRequest(zoneId=self.control.zone_id, value=False),
+            value=DoorState.MOVING,
         )
-        self.control.value = DoorState.MOVING
-        self.async_write_ha_state()
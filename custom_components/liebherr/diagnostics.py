@@ -18,6 +18,7 @@ import homeassistant.helpers.device_registry as dr
 import homeassistant.helpers.entity_registry as er
 
 from . import LiebherrConfigEntry
+from .const import DOMAIN
 
 TO_REDACT_CONFIG_ENTRY: list[str] = [CONF_API_KEY, CONF_DEVICE_ID]
 
@@ -44,6 +45,22 @@ async def async_get_config_entry_diagnostics(
             "options": async_redact_data(entry.options, TO_REDACT_CONFIG_ENTRY),
         },
         "data": async_redact_data(devices, TO_REDACT_CONFIG_ENTRY),
+        "hub": async_redact_data(
+            entry.runtime_data.hub.async_get_stats(), TO_REDACT_CONFIG_ENTRY
+        ),
+        "scheduler": entry.runtime_data.scheduler.async_get_stats(),
+        "traces": async_redact_data(
+            [
+                {CONF_DEVICE_ID: device_id, "trace": trace.async_as_list()}
+                for device_id, trace in entry.runtime_data.hub.traces.items()
+            ],
+            TO_REDACT_CONFIG_ENTRY,
+        ),
+        "image_variants": {
+            "bytes": entry.runtime_data.image_variants.size,
+            "hits": entry.runtime_data.image_variants.hits,
+            "misses": entry.runtime_data.image_variants.misses,
+        },
     }
 
 
@@ -73,4 +90,10 @@ async def async_get_device_diagnostics(
     if entities:
         data["entities"] = entities
 
+    for domain, device_id in device.identifiers:
+        if domain == DOMAIN and (
+            trace := config_entry.runtime_data.hub.traces.get(device_id)
+        ):
+            data["trace"] = trace.async_as_list()
+
     return data
@@ -1,5 +1,6 @@
 """Base Entityfor Liebherr appliances."""
 
+from datetime import datetime
 import logging
 from typing import Any
 
@@ -11,14 +12,18 @@ from pyliebherr import (
     LiebherrControlRequest,
     LiebherrDevice,
 )
-from pyliebherr.exception import LiebherrSSEException
 
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from . import LiebherrConfigEntry
-from .const import DOMAIN
+from . import LiebherrConfigEntry, LiebherrControlIndex
+from .const import DOMAIN, OPTIMISTIC_TIMEOUT, SIGNAL_DEVICE_READY
+from .hub import LiebherrHub
+from .writer import LiebherrStateWriter
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -53,10 +58,17 @@ class LiebherrEntity(Entity):
         """Initialize the entity."""
         self._attr_has_entity_name = True
         control: LiebherrControl = device.controls[control_key]
-        device.controls[control_key].update_callback = self.async_write_ha_state
         self.api: LiebherrAPI = config_entry.runtime_data.api
+        self.hub: LiebherrHub = config_entry.runtime_data.hub
         self.device: LiebherrDevice = device
         self.control_key: LiebherrControlKey = control_key
+        self.last_state_signature: Any = None
+        # Optimistic values and the last values confirmed by the device
+        self._optimistic: dict[str, Any] = {}
+        self._confirmed: dict[str, Any] = {}
+        self._optimistic_sent: bool = False
+        self._optimistic_generation: int = 0
+        self._cancel_rollback: CALLBACK_TYPE | None = None
         self._attr_unique_id = async_get_unique_id(
             device.device_id, control.control_name, control.zone_id
         )
@@ -67,15 +79,98 @@ class LiebherrEntity(Entity):
                 "zone": f" {config_entry.runtime_data.translations[f'component.{DOMAIN}.common.{control.zone_position}']}",
             }
 
-        def _error_callback(exc: LiebherrSSEException) -> None:
-            """Wrapper function used to update the state to unavailable."""
-            self.async_write_ha_state()
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to control updates routed by the hub."""
+        await super().async_added_to_hass()
+        writer: LiebherrStateWriter = self.hub.writers[self.device.device_id]
+        self.async_on_remove(
+            self.hub.async_add_listener(
+                self.device, self.control_key, self._async_handle_control_update
+            )
+        )
+        self.async_on_remove(
+            self.hub.availability[self.device.device_id].async_add_entity(self)
+        )
+        self.async_on_remove(lambda: writer.async_discard(self))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending rollback."""
+        if self._cancel_rollback:
+            self._cancel_rollback()
+            self._cancel_rollback = None
+
+    @callback
+    def _async_handle_control_update(self) -> None:
+        """Reconcile optimistic values with the update, then schedule a write."""
+        if self._optimistic:
+            if self._optimistic_sent:
+                # First update after the command was accepted
+                self._async_clear_optimistic()
+            else:
+                # Update predates the command, keep showing the requested values
+                self._confirmed = self._get_control_values(self._optimistic)
+                self._set_control_values(self._optimistic)
+        self.hub.writers[self.device.device_id].async_schedule_write(self)
+
+    def _get_control_values(self, attributes: dict[str, Any]) -> dict[str, Any]:
+        return {attribute: getattr(self.control, attribute) for attribute in attributes}
 
-        device.add_error_callback(_error_callback)
+    def _set_control_values(self, values: dict[str, Any]) -> None:
+        for attribute, value in values.items():
+            setattr(self.control, attribute, value)
 
-    def available(self):
-        """Available (SSE connected?)."""
-        return self.device.available
+    @callback
+    def _async_clear_optimistic(self) -> None:
+        self._optimistic = {}
+        self._confirmed = {}
+        self._optimistic_sent = False
+        if self._cancel_rollback:
+            self._cancel_rollback()
+            self._cancel_rollback = None
+
+    @callback
+    def _async_rollback(self) -> None:
+        """Restore the last values confirmed by the device."""
+        self._set_control_values(self._confirmed)
+        self._async_clear_optimistic()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_rollback_timeout(self, _: datetime) -> None:
+        self._cancel_rollback = None
+        _LOGGER.debug(
+            "No update for %s of %s after %ds, rolling back",
+            self.control_key,
+            self.device.device_id,
+            OPTIMISTIC_TIMEOUT,
+        )
+        self._async_rollback()
+
+    def state_signature(self) -> Any:
+        """Everything that ends up in the state machine, used to skip writes."""
+        return (
+            self.available,
+            self.assumed_state,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Remember what was written."""
+        self.last_state_signature = self.state_signature()
+        super()._async_write_ha_state()
+
+    @property
+    def assumed_state(self) -> bool:
+        """State is restored from the snapshot until the device reports in."""
+        return self.device.device_id in self.hub.stale
+
+    @property
+    def available(self) -> bool:
+        """Available unless the stream is down for longer than the grace period."""
+        return self.hub.availability[self.device.device_id].available
 
     @property
     def control(self) -> LiebherrControl:
@@ -85,8 +180,57 @@ class LiebherrEntity(Entity):
     async def async_set_value(
         self, control: LiebherrControlRequest
     ) -> list[dict[str, Any]]:
-        """Call api method for device via coordinator."""
-        return await self.api.async_set_value(self.device.device_id, control)
+        """Send a command, coalesced with other commands for the control."""
+        return await self.hub.commands[self.device.device_id].async_send(
+            self.control_key, control
+        )
+
+    async def async_set_optimistic(
+        self, control: LiebherrControlRequest, **values: Any
+    ) -> None:
+        """Show the new control values right away, then send the command.
+
+        The values are confirmed by the first update of the control after the
+        command was accepted, and rolled back to the last confirmed values if
+        the command fails or no update arrives within OPTIMISTIC_TIMEOUT.
+        """
+        self._confirmed = {
+            **self._get_control_values(values),
+            **self._confirmed,
+        }
+        self._optimistic.update(values)
+        self._optimistic_sent = False
+        self._optimistic_generation += 1
+        generation: int = self._optimistic_generation
+        self._set_control_values(values)
+        self.async_write_ha_state()
+
+        if self._cancel_rollback:
+            self._cancel_rollback()
+        self._cancel_rollback = async_call_later(
+            self.hass, OPTIMISTIC_TIMEOUT, self._async_rollback_timeout
+        )
+        try:
+            await self.async_set_value(control)
+        except Exception:
+            if generation == self._optimistic_generation:
+                self._async_rollback()
+            raise
+        if generation == self._optimistic_generation:
+            self._optimistic_sent = True
+
+
+def _async_get_entities(
+    config_entry: LiebherrConfigEntry,
+    controls: LiebherrControlIndex,
+    liebherr_entity_class: type[LiebherrEntity],
+    control_type: ControlType,
+) -> list[LiebherrEntity]:
+    """Create the entities for the indexed controls of the given type."""
+    return [
+        liebherr_entity_class(config_entry, device, control_key)
+        for device, control_key in controls.get(control_type, [])
+    ]
 
 
 async def base_async_setup_entry(
@@ -97,21 +241,30 @@ async def base_async_setup_entry(
 ) -> None:
     """Set up Liebherr appliances as devices and entities from a config entry."""
 
-    entities: list[LiebherrEntity] = []
-    for device in config_entry.runtime_data.devices:
-        if not device.controls:
-            _LOGGER.warning("No controls found for device %s", device.device_id)
-            continue
-        if device.device_type in LiebherrDevice.DeviceType:
-            for control in device.controls.values():
-                if control.type == control_type:
-                    entities.extend(
-                        [
-                            liebherr_entity_class(
-                                config_entry,
-                                device,
-                                (control.control_name, control.zone_id),
-                            )
-                        ]
-                    )
-    async_add_entities(entities)
+    async_add_entities(
+        _async_get_entities(
+            config_entry,
+            config_entry.runtime_data.controls,
+            liebherr_entity_class,
+            control_type,
+        )
+    )
+
+    @callback
+    def _async_add_device(
+        device: LiebherrDevice, controls: LiebherrControlIndex
+    ) -> None:
+        """Add the entities of a device that reported in after setup."""
+        async_add_entities(
+            _async_get_entities(
+                config_entry, controls, liebherr_entity_class, control_type
+            )
+        )
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            config_entry.runtime_data.hub.hass,
+            SIGNAL_DEVICE_READY.format(config_entry.entry_id),
+            _async_add_device,
+        )
+    )
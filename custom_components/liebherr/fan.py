@@ -59,7 +59,6 @@ class LiebherrFan(LiebherrEntity, FanEntity):
             | FanEntityFeature.TURN_ON
             | FanEntityFeature.SET_SPEED
         )
-        self._set_percentage()
 
     @property
     def is_on(self) -> bool:
@@ -74,27 +73,20 @@ class LiebherrFan(LiebherrEntity, FanEntity):
             return self.control.current_mode
         return HydroBreezeControlRequest.HydroBreezeMode.OFF
 
-    def _set_percentage(
-        self,
-    ) -> None:
-        self._attr_percentage = get_percent(self._mode)
-
-    def _handle_coordinator_update(self) -> None:
-        super()._handle_coordinator_update(False)
-        self._set_percentage()
-        self.async_write_ha_state()
+    @property
+    def percentage(self) -> int:
+        """Speed as a percentage."""
+        return get_percent(self._mode)
 
     async def _async_set_mode(
         self, mode: HydroBreezeControlRequest.HydroBreezeMode
     ) -> None:
-        await self.async_set_value(
-            control=HydroBreezeControlRequest(
+        await self.async_set_optimistic(
+            HydroBreezeControlRequest(
                 hydroBreezeMode=mode, zoneId=self.control.zone_id or 0
             ),
+            current_mode=mode,
         )
-        self.control.current_mode = mode
-        self._set_percentage()
-        self.async_write_ha_state()
 
     async def async_turn_on(
         self,
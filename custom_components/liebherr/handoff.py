@@ -0,0 +1,82 @@
+"""Hand the client validated by the config flow over to the first setup."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+from pyliebherr import LiebherrAPI, LiebherrDevice
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, HANDOFF_TTL
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+HANDOFFS: HassKey[dict[str, "LiebherrHandoff"]] = HassKey(f"{DOMAIN}_handoffs")
+
+
+@dataclass
+class LiebherrHandoff:
+    """A validated client and its device listing, fetched in the background."""
+
+    api: LiebherrAPI
+    devices: asyncio.Task[list[LiebherrDevice] | None]
+    cancel_expiry: CALLBACK_TYPE
+
+
+async def _async_get_devices(api: LiebherrAPI) -> list[LiebherrDevice] | None:
+    """List the devices, None if they could not be listed."""
+    try:
+        return await api.async_get_devices()
+    except Exception as ex:  # noqa: BLE001
+        # The setup falls back to listing the devices itself
+        _LOGGER.debug("Unable to list the devices for the handoff: %s", ex)
+        return None
+
+
+@callback
+def async_store_handoff(hass: HomeAssistant, api_key: str, api: LiebherrAPI) -> None:
+    """Keep a validated client for the setup following the flow.
+
+    The device listing starts right away, overlapping the entry creation.
+    The client is closed if no setup claims it within HANDOFF_TTL.
+    """
+    handoffs: dict[str, LiebherrHandoff] = hass.data.setdefault(HANDOFFS, {})
+    if previous := handoffs.pop(api_key, None):
+        _async_discard(hass, previous)
+
+    @callback
+    def _async_expire(_: datetime) -> None:
+        if (handoff := handoffs.get(api_key)) and handoff.api is api:
+            del handoffs[api_key]
+            _async_discard(hass, handoff)
+
+    handoffs[api_key] = LiebherrHandoff(
+        api,
+        hass.async_create_background_task(
+            _async_get_devices(api), "liebherr handoff devices"
+        ),
+        async_call_later(hass, HANDOFF_TTL, _async_expire),
+    )
+
+
+@callback
+def async_pop_handoff(hass: HomeAssistant, api_key: str) -> LiebherrHandoff | None:
+    """Claim the client validated for the API key, if there is one."""
+    if (handoff := hass.data.get(HANDOFFS, {}).pop(api_key, None)) is None:
+        return None
+    handoff.cancel_expiry()
+    return handoff
+
+
+@callback
+def _async_discard(hass: HomeAssistant, handoff: LiebherrHandoff) -> None:
+    """Close an unclaimed client."""
+    handoff.cancel_expiry()
+    handoff.devices.cancel()
+    hass.async_create_background_task(
+        handoff.api.async_close(), "liebherr close handoff"
+    )
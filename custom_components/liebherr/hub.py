@@ -0,0 +1,290 @@
+"""SSE hub for Liebherr appliances."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import asyncio
+import logging
+import sys
+import time
+from typing import Any
+
+from pyliebherr import LiebherrAPI, LiebherrControlKey, LiebherrDevice
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .availability import LiebherrAvailabilityTracker
+from .commands import LiebherrCommandQueue
+from .const import AVAILABILITY_GRACE, CONTROLS_POLL_INTERVAL
+from .scheduler import LiebherrRequestScheduler
+from .trace import LiebherrTrace, LiebherrTraceEntry
+from .writer import LiebherrStateWriter
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+def _approximate_size(obj: Any) -> int:
+    """Approximate the memory footprint of a (nested) python object."""
+    size: int = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _approximate_size(key) + _approximate_size(value)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_approximate_size(item) for item in obj)
+    return size
+
+
+@dataclass
+class LiebherrStreamStats:
+    """SSE statistics for a single device."""
+
+    events: int = 0
+    stream_starts: int = 0
+    stream_started: float | None = None
+    last_event: float | None = None
+    ready_after: float | None = None
+
+
+class LiebherrHub:
+    """Owns the SSE streams of a config entry and routes their events.
+
+    The HomeAPI only offers a stream per device, so the hub guarantees there
+    is never more than one upstream connection per appliance and that every
+    control update is dispatched through a single callback per control.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: LiebherrAPI,
+        scheduler: LiebherrRequestScheduler,
+        availability_grace: float = AVAILABILITY_GRACE,
+    ) -> None:
+        """Initialize the hub."""
+        self.hass: HomeAssistant = hass
+        self.api: LiebherrAPI = api
+        self.scheduler: LiebherrRequestScheduler = scheduler
+        self.availability_grace: float = availability_grace
+        self.devices: dict[str, LiebherrDevice] = {}
+        self.stats: dict[str, LiebherrStreamStats] = {}
+        self._streams: dict[str, Callable[[], None]] = {}
+        self.stale: set[str] = set()
+        self.writers: dict[str, LiebherrStateWriter] = {}
+        self.commands: dict[str, LiebherrCommandQueue] = {}
+        self.availability: dict[str, LiebherrAvailabilityTracker] = {}
+        self.traces: dict[str, LiebherrTrace] = {}
+        self._listeners: dict[
+            str, dict[LiebherrControlKey, list[Callable[[], None]]]
+        ] = {}
+        self._device_listeners: list[Callable[[LiebherrDevice], None]] = []
+
+    @callback
+    def async_add_device(self, device: LiebherrDevice, stale: bool = False) -> None:
+        """Track a device, its stream is started with async_start_stream.
+
+        Stale devices were restored from a snapshot and remain stale until
+        their stream delivers the first update.
+        """
+        if stale:
+            self.stale.add(device.device_id)
+        self.devices[device.device_id] = device
+        self.stats.setdefault(
+            device.device_id, LiebherrStreamStats(stream_started=time.monotonic())
+        )
+        self._listeners.setdefault(device.device_id, {})
+        self.writers.setdefault(device.device_id, LiebherrStateWriter(self.hass))
+        if device.device_id not in self.availability:
+            self.availability[device.device_id] = LiebherrAvailabilityTracker(
+                self.hass,
+                device,
+                self.writers[device.device_id],
+                self.availability_grace,
+            )
+        trace: LiebherrTrace = self.traces.setdefault(
+            device.device_id, LiebherrTrace()
+        )
+        if device.device_id not in self.commands:
+            self.commands[device.device_id] = LiebherrCommandQueue(
+                self.hass, self.api, self.scheduler, device.device_id, trace
+            )
+
+    @callback
+    def async_start_stream(self, device: LiebherrDevice, delay: int = 0) -> None:
+        """(Re)start the SSE stream of a device, replacing any existing stream."""
+        self.async_add_device(device)
+        self.async_stop_stream(device.device_id)
+        self._streams[device.device_id] = self.api.start_sse(device, delay=delay)
+        stats: LiebherrStreamStats = self.stats[device.device_id]
+        stats.stream_starts += 1
+        stats.stream_started = time.monotonic() + delay
+
+    async def async_wait_for_controls(
+        self, device: LiebherrDevice, timeout: float | None = None
+    ) -> bool:
+        """Wait for the stream of a device to deliver its controls.
+
+        Returns False if the controls did not arrive within the timeout.
+        """
+        deadline: float | None = (
+            None if timeout is None else time.monotonic() + timeout
+        )
+        while not device.controls:
+            if device.device_id not in self.devices:
+                return False
+            interval: float = CONTROLS_POLL_INTERVAL
+            if deadline is not None:
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    return False
+                interval = min(interval, remaining)
+            await asyncio.sleep(interval)
+        stats: LiebherrStreamStats = self.stats[device.device_id]
+        if stats.ready_after is None and stats.stream_started is not None:
+            stats.ready_after = max(time.monotonic() - stats.stream_started, 0)
+            _LOGGER.info(
+                "Controls of %s arrived %.1fs after starting its stream",
+                device.device_id,
+                stats.ready_after,
+            )
+        return True
+
+    @callback
+    def async_stop_stream(self, device_id: str) -> None:
+        """Cancel the stream of a device if the hub owns one."""
+        if (cancel := self._streams.pop(device_id, None)) and callable(cancel):
+            cancel()
+
+    @callback
+    def async_remove_device(self, device_id: str) -> None:
+        """Stop tracking a device that was removed from the account."""
+        self.async_stop_stream(device_id)
+        self.devices.pop(device_id, None)
+        self.stats.pop(device_id, None)
+        self.stale.discard(device_id)
+        self._listeners.pop(device_id, None)
+        self.writers.pop(device_id, None)
+        self.traces.pop(device_id, None)
+        if commands := self.commands.pop(device_id, None):
+            commands.async_shutdown()
+        if availability := self.availability.pop(device_id, None):
+            availability.async_shutdown()
+
+    @callback
+    def async_add_listener(
+        self,
+        device: LiebherrDevice,
+        control_key: LiebherrControlKey,
+        update_callback: Callable[[], None],
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of a control, returns a function to unsubscribe."""
+        self.async_add_device(device)
+        listeners: list[Callable[[], None]] = self._listeners[
+            device.device_id
+        ].setdefault(control_key, [])
+        listeners.append(update_callback)
+        device.controls[control_key].update_callback = (
+            lambda: self._async_dispatch(device.device_id, control_key)
+        )
+
+        @callback
+        def _remove_listener() -> None:
+            if update_callback in listeners:
+                listeners.remove(update_callback)
+
+        return _remove_listener
+
+    @callback
+    def async_add_device_listener(
+        self, update_callback: Callable[[LiebherrDevice], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of any control of any device."""
+        self._device_listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            self._device_listeners.remove(update_callback)
+
+        return _remove_listener
+
+    @callback
+    def _async_dispatch(self, device_id: str, control_key: LiebherrControlKey) -> None:
+        """Route a control update to the entities listening for it."""
+        if device_id not in self.devices:
+            return
+        stats: LiebherrStreamStats = self.stats[device_id]
+        stats.events += 1
+        start: float = time.monotonic()
+        stats.last_event = start
+        self.availability[device_id].async_update()
+        listeners: list[Callable[[], None]]
+        if device_id in self.stale:
+            # First live update, refresh every entity of the device
+            self.stale.discard(device_id)
+            listeners = [
+                update_callback
+                for control_listeners in self._listeners[device_id].values()
+                for update_callback in control_listeners
+            ]
+        else:
+            listeners = list(self._listeners[device_id].get(control_key, []))
+        for update_callback in listeners:
+            update_callback()
+        for device_callback in list(self._device_listeners):
+            device_callback(self.devices[device_id])
+        trace: LiebherrTrace = self.traces[device_id]
+        entry: LiebherrTraceEntry = trace.async_add_event(control_key, start)
+        # Runs after the state writer flushed the writes scheduled above
+        self.hass.loop.call_soon(trace.async_written, entry, start)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all streams owned by the hub, pending commands and timers."""
+        for device_id in list(self._streams):
+            self.async_stop_stream(device_id)
+        for commands in self.commands.values():
+            commands.async_shutdown()
+        for availability in self.availability.values():
+            availability.async_shutdown()
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Connection, task and memory accounting for diagnostics."""
+        now: float = time.monotonic()
+        devices: list[dict[str, Any]] = []
+        for device_id, device in self.devices.items():
+            stats: LiebherrStreamStats = self.stats[device_id]
+            devices.append(
+                {
+                    "device_id": device_id,
+                    "connected": device.available,
+                    "stale": device_id in self.stale,
+                    **self.availability[device_id].async_get_stats(),
+                    "owned_stream": device_id in self._streams,
+                    "stream_starts": stats.stream_starts,
+                    "ready_after": (
+                        round(stats.ready_after, 1) if stats.ready_after else None
+                    ),
+                    "events": stats.events,
+                    "seconds_since_last_event": (
+                        round(now - stats.last_event, 1) if stats.last_event else None
+                    ),
+                    "state_writes": self.writers[device_id].writes,
+                    "suppressed_state_writes": self.writers[device_id].suppressed,
+                    "commands_sent": self.commands[device_id].sent,
+                    "commands_coalesced": self.commands[device_id].coalesced,
+                    "listeners": sum(
+                        len(listeners)
+                        for listeners in self._listeners[device_id].values()
+                    ),
+                    "approximate_memory_bytes": _approximate_size(
+                        device.model_dump()
+                    ),
+                }
+            )
+        return {
+            "connections": sum(
+                1 for device in self.devices.values() if device.available
+            ),
+            "owned_streams": len(self._streams),
+            "devices": devices,
+        }
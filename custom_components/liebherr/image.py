@@ -1,10 +1,12 @@
 """Support for Liebherr mode switches."""
 
+import asyncio
 from datetime import datetime
+import hashlib
 from io import BytesIO
 import logging
 
-from PIL.Image import Image as PImage, open
+import httpx
 from pyliebherr import LiebherrDevice
 
 from homeassistant.components.image import (
@@ -13,24 +15,202 @@ from homeassistant.components.image import (
     ImageEntity,
     valid_image_content_type,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.util.dt import as_utc
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.httpx_client import get_async_client
+from homeassistant.util.dt import as_utc, utcnow
 
-from . import LiebherrConfigEntry
+from . import LiebherrConfigEntry, LiebherrControlIndex
+from .const import (
+    IMAGE_FETCH_TIMEOUT,
+    IMAGE_PICTURE_WIDTH,
+    IMAGE_PREFETCH_CONCURRENCY,
+    IMAGE_VARIANT_WIDTHS,
+    SIGNAL_DEVICE_READY,
+)
 from .entity import async_get_device_info, async_get_unique_id
+from .image_cache import (
+    LiebherrCachedImage,
+    LiebherrImageCache,
+    LiebherrImageVariants,
+)
+from .scheduler import LiebherrRequestScheduler, RequestPriority, parse_retry_after
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _reduce_image(content: bytes) -> bytes:
+    """Reduce the image to a quarter of its size (runs in the executor)."""
+    # Pillow is imported on first use (in the executor), not at startup
+    from PIL.Image import open  # noqa: PLC0415
+
+    with open(BytesIO(content)) as image, image.reduce(4) as reduced:
+        new_image: BytesIO = BytesIO()
+        reduced.save(new_image, "PNG")
+    return new_image.getvalue()
+
+
+def _resize_image(content: bytes, width: int, image_format: str) -> bytes:
+    """Scale the image down to a width and convert it (runs in the executor)."""
+    from PIL.Image import open  # noqa: PLC0415
+
+    with open(BytesIO(content)) as image:
+        if width and width < image.width:
+            image.thumbnail((width, image.height))
+        new_image: BytesIO = BytesIO()
+        image.save(new_image, image_format.upper())
+    return new_image.getvalue()
+
+
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: LiebherrConfigEntry, async_add_entities
 ):
     """Set up Liebherr switches from a config entry."""
 
+    loader: LiebherrImageLoader = LiebherrImageLoader(hass, config_entry)
     async_add_entities(
-        [LiebherrImage(hass, device) for device in config_entry.runtime_data.devices]
+        [
+            LiebherrImage(hass, config_entry, loader, device)
+            for device in config_entry.runtime_data.devices
+        ]
+    )
+    config_entry.async_create_background_task(
+        hass,
+        loader.async_prefetch(
+            [device.image_url for device in config_entry.runtime_data.devices]
+        ),
+        "liebherr image prefetch",
     )
 
+    @callback
+    def _async_add_device(
+        device: LiebherrDevice, _controls: LiebherrControlIndex
+    ) -> None:
+        """Add the image of a device that reported in after setup."""
+        async_add_entities([LiebherrImage(hass, config_entry, loader, device)])
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICE_READY.format(config_entry.entry_id), _async_add_device
+        )
+    )
+
+
+class LiebherrImageLoader:
+    """Loads the device images of a config entry.
+
+    Each url is fetched once, no matter how many devices share it, and images
+    with identical content (i.e. the same model under different urls) are
+    decoded once and share their memory.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: LiebherrConfigEntry) -> None:
+        """Initialize the loader."""
+        self.hass: HomeAssistant = hass
+        self.scheduler: LiebherrRequestScheduler = config_entry.runtime_data.scheduler
+        self.image_cache: LiebherrImageCache = config_entry.runtime_data.image_cache
+        self._client: httpx.AsyncClient = get_async_client(hass)
+        self._images: dict[str, asyncio.Task[LiebherrCachedImage | None]] = {}
+        self._reduced: dict[str, bytes] = {}
+
+    async def async_load(self, url: str) -> LiebherrCachedImage | None:
+        """Load an image, sharing the download with concurrent and later calls."""
+        if (task := self._images.get(url)) is None or (
+            task.done()
+            and (
+                task.cancelled()
+                or task.exception() is not None
+                or task.result() is None
+            )
+        ):
+            # Not loaded yet (or failed before)
+            task = self._images[url] = self.hass.async_create_task(
+                self._async_load(url), f"liebherr load image {url}"
+            )
+        return await asyncio.shield(task)
+
+    async def async_prefetch(self, urls: list[str | None]) -> None:
+        """Load the images in the background, a few at a time."""
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(IMAGE_PREFETCH_CONCURRENCY)
+
+        async def _async_prefetch(url: str) -> None:
+            async with semaphore:
+                await self.async_load(url)
+
+        await asyncio.gather(*(_async_prefetch(url) for url in set(urls) if url))
+
+    async def _fetch_url(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> httpx.Response | None:
+        """Fetch the image within the request budget, honoring Retry-After."""
+        await self.scheduler.async_acquire(RequestPriority.IMAGE)
+        try:
+            response: httpx.Response = await self._client.get(
+                url, headers=headers, timeout=IMAGE_FETCH_TIMEOUT, follow_redirects=True
+            )
+        except httpx.HTTPError as ex:
+            _LOGGER.error("Error getting new image from %s: %s", url, ex)
+            return None
+        if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            self.scheduler.async_throttle(
+                parse_retry_after(response.headers.get("retry-after"))
+            )
+            return None
+        if response.is_error:
+            _LOGGER.error(
+                "Error getting new image from %s: %s", url, response.status_code
+            )
+            return None
+        return response
+
+    async def _async_load(self, url: str) -> LiebherrCachedImage | None:
+        """Load an image, revalidating the cached image if there is one."""
+        cached: LiebherrCachedImage | None = await self.image_cache.async_get(url)
+        headers: dict[str, str] = {}
+        # Images cached without the digest of the download are fetched again
+        if cached and cached.digest and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.digest and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        response: httpx.Response | None = await self._fetch_url(url, headers)
+        if response is None or response.status_code == httpx.codes.NOT_MODIFIED:
+            # Unchanged (or the cloud is unavailable), use the cached image
+            if cached is not None and cached.digest:
+                cached.content = self._reduced.setdefault(
+                    cached.digest, cached.content
+                )
+            return cached
+
+        content_type = response.headers.get("content-type")
+        if content_type == ".png":
+            content_type = "image/png"
+        try:
+            valid_image_content_type(content_type)
+        except ImageContentTypeError:
+            _LOGGER.error(
+                "Image from %s has invalid content type: %s", url, content_type
+            )
+            return None
+        digest: str = hashlib.sha256(response.content).hexdigest()
+        if (content := self._reduced.get(digest)) is None:
+            try:
+                content = await self.hass.async_add_executor_job(
+                    _reduce_image, response.content
+                )
+            except Exception as ex:  # noqa: BLE001
+                # Pillow raises OSError, ValueError and its own decode errors
+                _LOGGER.error("Unable to decode the image from %s: %s", url, ex)
+                return None
+            self._reduced[digest] = content
+        image: LiebherrCachedImage = LiebherrCachedImage(
+            content,
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+            digest,
+        )
+        await self.image_cache.async_put(url, image)
+        return image
+
 
 class LiebherrImage(ImageEntity):
     """Image of the device."""
@@ -38,49 +218,80 @@ class LiebherrImage(ImageEntity):
     def __init__(
         self,
         hass: HomeAssistant,
+        config_entry: LiebherrConfigEntry,
+        loader: LiebherrImageLoader,
         device: LiebherrDevice,
     ) -> None:
         """Initialize the image entity."""
         self.has_entity_name = True
         super().__init__(hass=hass)
+        self.loader: LiebherrImageLoader = loader
+        self.image_variants: LiebherrImageVariants = (
+            config_entry.runtime_data.image_variants
+        )
+        self.images: dict[str, LiebherrImage] = config_entry.runtime_data.images
         self.unique_id = async_get_unique_id(device.device_id, "image")
         self._attr_device_info = async_get_device_info(device)
         self._attr_content_type = "image/png"
         self._attr_icon = "mdi:image"
         self._attr_image_url = device.image_url
         self._attr_translation_key = "device_image"
+        self._digest: str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the entity with the image view."""
+        await super().async_added_to_hass()
+        self.images[self.entity_id] = self
+        self.async_on_remove(lambda: self.images.pop(self.entity_id, None))
+
+    @property
+    def entity_picture(self) -> str:
+        """Picture sized for dashboard cards, served by the image view."""
+        return (
+            f"/api/liebherr/image/{self.entity_id}"
+            f"?token={self.access_tokens[-1]}&width={IMAGE_PICTURE_WIDTH}"
+        )
+
+    async def async_image_variant(self, width: int, image_format: str) -> bytes | None:
+        """The image scaled to the smallest variant at least width wide."""
+        if (content := await self.async_image()) is None:
+            return None
+        variant_width: int = next(
+            (
+                variant_width
+                for variant_width in IMAGE_VARIANT_WIDTHS
+                if variant_width >= width
+            ),
+            0,
+        )
+        if not variant_width and image_format == "png":
+            # Full size PNG
+            return content
+        return await self.image_variants.async_get(
+            (self._digest or str(self.image_url), variant_width, image_format),
+            lambda: self.hass.async_add_executor_job(
+                _resize_image, content, variant_width, image_format
+            ),
+        )
 
     async def _async_load_image_from_url(self, url: str) -> Image | None:
-        """Load an image by url."""
-        if response := await self._fetch_url(url):
-            content_type = response.headers.get("content-type")
-            last_modified: datetime = as_utc(
-                datetime.strptime(
-                    response.headers.get("last-modified"), "%a, %d %b %Y %H:%M:%S %Z"
-                )
-            )
-            if content_type == ".png":
-                content_type = "image/png"
+        """Load an image by url through the loader shared by the entry."""
+        if (image := await self.loader.async_load(url)) is None:
+            return None
+        return self._async_set_image(image)
+
+    @callback
+    def _async_set_image(self, image: LiebherrCachedImage) -> Image:
+        """Update the last updated timestamp from the image validators."""
+        last_modified: datetime | None = None
+        if image.last_modified:
             try:
-                valid_image_content_type(content_type)
-                io_image: BytesIO = BytesIO(response.content)
-                image: PImage = open(
-                    io_image
-                )  # await self.hass.async_add_executor_job(open, io_image)
-                new_pimage: PImage = image.reduce(4)
-                image.close()
-                new_image: BytesIO = BytesIO()
-                new_pimage.save(new_image, "PNG")
-                new_pimage.close()
-                self._attr_image_last_updated = last_modified
-                self.async_write_ha_state()
-                return Image(content_type, new_image.getvalue())
-            except ImageContentTypeError:
-                _LOGGER.error(
-                    "%s: Image from %s has invalid content type: %s",
-                    self.entity_id,
-                    url,
-                    content_type,
+                last_modified = as_utc(
+                    datetime.strptime(image.last_modified, "%a, %d %b %Y %H:%M:%S %Z")
                 )
-                return None
-        return None
+            except ValueError:
+                _LOGGER.debug("Invalid last-modified header: %s", image.last_modified)
+        self._attr_image_last_updated = last_modified or utcnow()
+        self._digest = image.digest
+        self.async_write_ha_state()
+        return Image("image/png", image.content)
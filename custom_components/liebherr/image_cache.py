@@ -0,0 +1,145 @@
+"""On-disk cache of the Liebherr device images."""
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, IMAGE_CACHE_MAX_BYTES, IMAGE_VARIANT_CACHE_BYTES
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LiebherrCachedImage:
+    """A cached (reduced) image, the validators and the digest of its source."""
+
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    digest: str | None = None
+
+
+class LiebherrImageCache:
+    """Reduced device images keyed by their url, bounded in size.
+
+    Every file operation runs in the executor. When the cache grows over
+    max_bytes the least recently used images are evicted.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_bytes: int = IMAGE_CACHE_MAX_BYTES
+    ) -> None:
+        """Initialize the cache."""
+        self.hass: HomeAssistant = hass
+        self.max_bytes: int = max_bytes
+        self.path: Path = Path(hass.config.path(".cache", DOMAIN, "images"))
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    async def async_get(self, url: str) -> LiebherrCachedImage | None:
+        """Get the cached image for a url."""
+        return await self.hass.async_add_executor_job(self._get, self._key(url))
+
+    async def async_put(self, url: str, image: LiebherrCachedImage) -> None:
+        """Cache the image for a url."""
+        await self.hass.async_add_executor_job(self._put, self._key(url), image)
+
+    def _get(self, key: str) -> LiebherrCachedImage | None:
+        image_file: Path = self.path / f"{key}.png"
+        try:
+            meta: dict[str, Any] = json.loads(
+                (self.path / f"{key}.json").read_text(encoding="utf-8")
+            )
+            image: LiebherrCachedImage = LiebherrCachedImage(
+                image_file.read_bytes(),
+                meta.get("etag"),
+                meta.get("last_modified"),
+                meta.get("digest"),
+            )
+        except (OSError, ValueError):
+            return None
+        try:
+            # Mark it recently used, without recreating a file evicted meanwhile
+            os.utime(image_file)
+        except OSError as ex:
+            _LOGGER.debug("Unable to mark cached image %s as used: %s", key, ex)
+        return image
+
+    def _put(self, key: str, image: LiebherrCachedImage) -> None:
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            (self.path / f"{key}.png").write_bytes(image.content)
+            (self.path / f"{key}.json").write_text(
+                json.dumps(
+                    {
+                        "etag": image.etag,
+                        "last_modified": image.last_modified,
+                        "digest": image.digest,
+                    }
+                ),
+                encoding="utf-8",
+            )
+            self._evict()
+        except OSError as ex:
+            _LOGGER.warning("Unable to cache image: %s", ex)
+
+    def _evict(self) -> None:
+        """Remove the least recently used images until under max_bytes."""
+        images: list[tuple[float, int, Path]] = []
+        for image_file in self.path.glob("*.png"):
+            stat = image_file.stat()
+            images.append((stat.st_mtime, stat.st_size, image_file))
+        total: int = sum(size for _, size, _ in images)
+        for _, size, image_file in sorted(images):
+            if total <= self.max_bytes:
+                break
+            image_file.unlink(missing_ok=True)
+            image_file.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+
+
+type LiebherrVariantKey = tuple[str, int, str]
+
+
+class LiebherrImageVariants:
+    """In-memory LRU of image variants (width and format), bounded in bytes.
+
+    Shared by every image entity of the config entry, so devices with the
+    same image share their variants.
+    """
+
+    def __init__(self, max_bytes: int = IMAGE_VARIANT_CACHE_BYTES) -> None:
+        """Initialize the cache."""
+        self.max_bytes: int = max_bytes
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self._variants: OrderedDict[LiebherrVariantKey, bytes] = OrderedDict()
+
+    async def async_get(
+        self,
+        key: LiebherrVariantKey,
+        create_variant: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """Get a variant, creating it if it isn't cached."""
+        if (content := self._variants.get(key)) is not None:
+            self.hits += 1
+            self._variants.move_to_end(key)
+            return content
+        self.misses += 1
+        content = await create_variant()
+        if key not in self._variants:
+            self._variants[key] = content
+            self.size += len(content)
+        while self.size > self.max_bytes and len(self._variants) > 1:
+            self.size -= len(self._variants.popitem(last=False)[1])
+        return content
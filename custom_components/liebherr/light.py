@@ -41,15 +41,22 @@ class LiebherrLight(LiebherrEntity, LightEntity):
         self._set_brightness()
 
     def _set_brightness(self) -> None:
+        """Track the target, the last brightness is kept while the light is off."""
         if self.control.target is not None and self.control.target > 0:
-            self._attr_brightness = self._attr_brightness = value_to_brightness(
+            self._attr_brightness = value_to_brightness(
                 self.brightness_scale, self.control.target
             )
 
+    def _set_control_values(self, values: dict[str, Any]) -> None:
+        """Optimistic values and their rollback change the brightness too."""
+        super()._set_control_values(values)
+        self._set_brightness()
+
     @callback
-    def _async_write_ha_state(self):
+    def _async_handle_control_update(self) -> None:
+        """Update the brightness before the write is scheduled."""
         self._set_brightness()
-        return super()._async_write_ha_state()
+        super()._async_handle_control_update()
 
     @property
     def is_on(self) -> bool:
@@ -64,22 +71,15 @@ class LiebherrLight(LiebherrEntity, LightEntity):
 
         # turn on via switch brightness not so will try to set to previous brightness
         # a brightness of zero won't turn on the light so turn on to max brightness
-        brightness: int = kwargs[ATTR_BRIGHTNESS] or self._attr_brightness or 255
+        brightness: int = kwargs.get(ATTR_BRIGHTNESS) or self._attr_brightness or 255
 
-        self.control.target = math.ceil(
-            brightness_to_value(self.brightness_scale, brightness)
+        target: int = math.ceil(brightness_to_value(self.brightness_scale, brightness))
+        await self.async_set_optimistic(
+            PresentationLightControlRequest(target=target), target=target
         )
-        await self.async_set_value(
-            control=PresentationLightControlRequest(target=self.control.target),
-        )
-
-        self._attr_brightness = brightness
-        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the light off."""
-        self.control.target = 0
-        await self.async_set_value(
-            control=PresentationLightControlRequest(target=0),
+        await self.async_set_optimistic(
+            PresentationLightControlRequest(target=0), target=0
         )
-        self.async_write_ha_state()
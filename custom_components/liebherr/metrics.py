@@ -0,0 +1,145 @@
+"""Performance metrics of the Liebherr hub."""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import math
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util.dt import utcnow
+
+from .hub import LiebherrHub, LiebherrStreamStats
+from .reconnect import LiebherrReconnectScheduler
+from .scheduler import LiebherrRequestScheduler
+
+
+def _per_minute(
+    count: int, previous: int | None, minutes: float | None
+) -> float | None:
+    """Rate of a counter since the previous sample."""
+    if previous is None or not minutes:
+        return None
+    return round(max(count - previous, 0) / minutes, 1)
+
+
+def _percentile(samples: list[float], percentile: int) -> float | None:
+    """Nearest rank percentile of the samples in milliseconds."""
+    if not samples:
+        return None
+    ordered: list[float] = sorted(samples)
+    rank: int = max(math.ceil(percentile / 100 * len(ordered)), 1)
+    return round(ordered[rank - 1] * 1000)
+
+
+class LiebherrMetrics:
+    """Samples the hub counters into rates and percentiles at a fixed interval.
+
+    The hub only increments counters on the hot path; rates are derived here
+    once per interval, so the sensors built on the samples write at most one
+    state per interval.
+    """
+
+    def __init__(
+        self,
+        hub: LiebherrHub,
+        reconnect: LiebherrReconnectScheduler,
+        scheduler: LiebherrRequestScheduler,
+    ) -> None:
+        """Initialize the metrics."""
+        self.hub: LiebherrHub = hub
+        self.reconnect: LiebherrReconnectScheduler = reconnect
+        self.scheduler: LiebherrRequestScheduler = scheduler
+        # Samples per device, the hub totals are keyed by None
+        self.values: dict[str | None, dict[str, Any]] = {}
+        self._counters: dict[str, tuple[int, int]] = {}
+        self._sampled: float | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for new samples, returns a function to unsubscribe."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove_listener
+
+    @callback
+    def async_sample(self, _: datetime | None = None) -> None:
+        """Take a sample and notify the listeners."""
+        now: float = time.monotonic()
+        wall: datetime = utcnow()
+        minutes: float | None = (now - self._sampled) / 60 if self._sampled else None
+        self._sampled = now
+
+        values: dict[str | None, dict[str, Any]] = {}
+        counters: dict[str, tuple[int, int]] = {}
+        latencies: list[float] = []
+        for device_id, stats in self.hub.stats.items():
+            writes: int = self.hub.writers[device_id].writes
+            previous: tuple[int | None, int | None] = self._counters.get(
+                device_id, (None, None)
+            )
+            counters[device_id] = (stats.events, writes)
+            device_latencies: list[float] = list(self.hub.commands[device_id].latencies)
+            latencies.extend(device_latencies)
+            values[device_id] = {
+                "events_per_minute": _per_minute(stats.events, previous[0], minutes),
+                "last_event": self._last_event(stats, now, wall),
+                "reconnects": (
+                    state.reconnects
+                    if (state := self.reconnect.states.get(device_id))
+                    else 0
+                ),
+                "command_latency_p50": _percentile(device_latencies, 50),
+                "command_latency_p95": _percentile(device_latencies, 95),
+                "command_queue_depth": self.hub.commands[device_id].depth,
+                "state_writes_per_minute": _per_minute(writes, previous[1], minutes),
+            }
+        self._counters = counters
+
+        devices: list[dict[str, Any]] = list(values.values())
+        values[None] = {
+            "events_per_minute": self._sum(devices, "events_per_minute"),
+            "last_event": max(
+                (device["last_event"] for device in devices if device["last_event"]),
+                default=None,
+            ),
+            "reconnects": sum(device["reconnects"] for device in devices),
+            "command_latency_p50": _percentile(latencies, 50),
+            "command_latency_p95": _percentile(latencies, 95),
+            "command_queue_depth": sum(
+                device["command_queue_depth"] for device in devices
+            ),
+            "state_writes_per_minute": self._sum(devices, "state_writes_per_minute"),
+            "connected_devices": sum(
+                1 for device in self.hub.devices.values() if device.available
+            ),
+            "request_queue_depth": self.scheduler.depth,
+        }
+        self.values = values
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @staticmethod
+    def _last_event(
+        stats: LiebherrStreamStats, now: float, wall: datetime
+    ) -> datetime | None:
+        """Wall clock time of the last event of a device."""
+        if stats.last_event is None:
+            return None
+        return (wall - timedelta(seconds=now - stats.last_event)).replace(
+            microsecond=0
+        )
+
+    @staticmethod
+    def _sum(devices: list[dict[str, Any]], key: str) -> float | None:
+        """Sum of a rate over the devices that have one."""
+        rates: list[float] = [
+            device[key] for device in devices if device[key] is not None
+        ]
+        return round(sum(rates), 1) if rates else None
@@ -56,11 +56,9 @@ class LiebherrNumber(LiebherrEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
         try:
-            await self.async_set_value(
-                control=PresentationLightControlRequest(target=int(value)),
+            await self.async_set_optimistic(
+                PresentationLightControlRequest(target=int(value)),
+                target=round(value),
             )
         except LiebherrException as ex:
             raise HomeAssistantError(f"Error setting value: {value}") from ex
-
-        self.control.target = round(value)
-        self.async_write_ha_state()
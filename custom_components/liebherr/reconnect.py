@@ -0,0 +1,167 @@
+"""Reconnect scheduling for Liebherr SSE streams."""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import random
+import time
+
+from pyliebherr import LiebherrDevice
+from pyliebherr.exception import LiebherrSSEException
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    RECONNECT_BASE_DELAY,
+    RECONNECT_CONNECT_TIMEOUT,
+    RECONNECT_MAX_CONCURRENT,
+    RECONNECT_MAX_DELAY,
+    RECONNECT_STABLE_AFTER,
+    RECONNECT_WARN_ATTEMPTS,
+)
+from .hub import LiebherrHub
+from .scheduler import RequestPriority
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LiebherrReconnectState:
+    """Reconnect bookkeeping for a single device."""
+
+    attempt: int = 0
+    reconnects: int = 0
+    connected_since: float | None = None
+    task: asyncio.Task | None = None
+
+
+class LiebherrReconnectScheduler:
+    """Reconnects dropped streams with capped, jittered exponential backoff.
+
+    Delays are randomized so a fleet that dropped at the same time (i.e. a WAN
+    outage) spreads its reconnects out, and a semaphore caps how many
+    connections are being established at once.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        hub: LiebherrHub,
+        max_concurrent: int = RECONNECT_MAX_CONCURRENT,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass: HomeAssistant = hass
+        self.config_entry: ConfigEntry = config_entry
+        self.hub: LiebherrHub = hub
+        self.states: dict[str, LiebherrReconnectState] = {}
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+        self._remove_listener: CALLBACK_TYPE = hub.async_add_device_listener(
+            self._async_handle_event
+        )
+
+    @staticmethod
+    def backoff(attempt: int) -> float:
+        """Jittered delay (seconds) before the given reconnect attempt."""
+        ceiling: float = min(
+            RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** max(attempt - 1, 0)
+        )
+        return random.uniform(RECONNECT_BASE_DELAY / 2, max(ceiling, 1))
+
+    def get_error_callback(
+        self, device: LiebherrDevice
+    ) -> Callable[[LiebherrSSEException], None]:
+        """Get the SSE error callback for a device."""
+        self.states.setdefault(
+            device.device_id, LiebherrReconnectState(connected_since=time.monotonic())
+        )
+
+        @callback
+        def _device_error_callback(exc: LiebherrSSEException) -> None:
+            self.async_schedule(device)
+
+        return _device_error_callback
+
+    @callback
+    def async_schedule(self, device: LiebherrDevice) -> None:
+        """Schedule a reconnect, superseding any reconnect already pending."""
+        if device.device_id not in self.hub.devices:
+            # Removed from the account
+            return
+        state: LiebherrReconnectState = self.states.setdefault(
+            device.device_id, LiebherrReconnectState()
+        )
+        if state.task and not state.task.done():
+            state.task.cancel()
+        if (
+            state.connected_since is not None
+            and time.monotonic() - state.connected_since >= RECONNECT_STABLE_AFTER
+        ):
+            # Connection was stable, start over
+            state.attempt = 0
+        state.connected_since = None
+        state.attempt += 1
+        delay: float = self.backoff(state.attempt)
+        _LOGGER.log(
+            logging.WARNING
+            if state.attempt == RECONNECT_WARN_ATTEMPTS
+            else logging.INFO,
+            "Retrying SSE connection to %s after %.0fs delay, attempt %d",
+            device.device_id,
+            delay,
+            state.attempt,
+        )
+        state.task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_reconnect(device, state, delay),
+            f"{device.device_id} SSE reconnect",
+        )
+
+    async def _async_reconnect(
+        self, device: LiebherrDevice, state: LiebherrReconnectState, delay: float
+    ) -> None:
+        """Wait out the backoff, then reconnect holding a concurrency slot."""
+        await asyncio.sleep(delay)
+        async with self._semaphore:
+            await self.hub.scheduler.async_acquire(RequestPriority.RECONNECT)
+            self.hub.async_start_stream(device)
+            state.reconnects += 1
+            # Hold the slot until connected so the next reconnects queue behind
+            deadline: float = time.monotonic() + RECONNECT_CONNECT_TIMEOUT
+            while not device.available and time.monotonic() < deadline:
+                await asyncio.sleep(1)
+        if device.available:
+            if state.connected_since is None:
+                state.connected_since = time.monotonic()
+            if availability := self.hub.availability.get(device.device_id):
+                availability.async_update()
+
+    @callback
+    def _async_handle_event(self, device: LiebherrDevice) -> None:
+        """A stream that delivers events is connected, even past the wait above."""
+        if (
+            (state := self.states.get(device.device_id))
+            and state.connected_since is None
+            and device.available
+        ):
+            state.connected_since = time.monotonic()
+
+    @callback
+    def async_remove_device(self, device_id: str) -> None:
+        """Forget a device, cancelling its pending reconnect."""
+        if (
+            (state := self.states.pop(device_id, None))
+            and state.task
+            and not state.task.done()
+        ):
+            state.task.cancel()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all pending reconnects."""
+        self._remove_listener()
+        for state in self.states.values():
+            if state.task and not state.task.done():
+                state.task.cancel()
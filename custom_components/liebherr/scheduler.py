@@ -0,0 +1,206 @@
+"""Shared request budget for calls to the Liebherr cloud."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+import heapq
+from http import HTTPStatus
+import itertools
+import logging
+import re
+import time
+from typing import Any, Final
+
+from pyliebherr.exception import LiebherrException
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import REQUEST_BURST, REQUEST_RATE, REQUEST_THROTTLE_BACKOFF
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Priority lanes, lower values are served first."""
+
+    COMMAND = 0
+    RECONNECT = 1
+    DISCOVERY = 2
+    IMAGE = 3
+
+
+@dataclass
+class LiebherrLaneStats:
+    """Request statistics of a priority lane."""
+
+    requests: int = 0
+    total_wait: float = 0
+    max_wait: float = 0
+
+
+# 429 next to the status text, so a 429 inside i.e. a device id does not match
+_THROTTLED: Final[re.Pattern[str]] = re.compile(
+    r"too many requests|\b(?:status|code|http)\W{0,3}429\b|\b429\W{0,3}too",
+    re.IGNORECASE,
+)
+
+
+def is_throttled(ex: LiebherrException) -> bool:
+    """Whether the cloud rejected a request because of rate limiting."""
+    for attribute in ("status", "status_code"):
+        if isinstance(status := getattr(ex, attribute, None), int):
+            return status == HTTPStatus.TOO_MANY_REQUESTS
+    return _THROTTLED.search(str(ex)) is not None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a Retry-After header (seconds or a date)."""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max((parsedate_to_datetime(value) - dt_util.utcnow()).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class LiebherrRequestScheduler:
+    """Token bucket shared by every request of a config entry.
+
+    Requests wait for a token in priority order, so user commands are served
+    before reconnects, discovery and images when the budget runs low. When
+    the cloud throttles, every lane pauses until Retry-After has passed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = REQUEST_RATE,
+        burst: int = REQUEST_BURST,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass: HomeAssistant = hass
+        self.rate: float = rate
+        self.burst: int = burst
+        self.throttled: int = 0
+        self.stats: dict[RequestPriority, LiebherrLaneStats] = {
+            priority: LiebherrLaneStats() for priority in RequestPriority
+        }
+        self._tokens: float = burst
+        self._updated: float = time.monotonic()
+        self._blocked_until: float = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence: itertools.count[int] = itertools.count()
+        self._handle: asyncio.TimerHandle | None = None
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def depth(self) -> int:
+        """Number of requests waiting for a token."""
+        return sum(1 for waiter in self._waiters if not waiter[2].done())
+
+    async def async_acquire(self, priority: RequestPriority) -> None:
+        """Wait until a request of the given priority may be sent."""
+        start: float = time.monotonic()
+        self._refill(start)
+        if not self._waiters and self._tokens >= 1 and start >= self._blocked_until:
+            self._tokens -= 1
+        else:
+            future: asyncio.Future[None] = self.hass.loop.create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            self._async_schedule_pump(0)
+            await future
+        wait: float = time.monotonic() - start
+        stats: LiebherrLaneStats = self.stats[priority]
+        stats.requests += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+
+    async def async_run[_T](
+        self, priority: RequestPriority, request: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run a pyliebherr request within the budget."""
+        await self.async_acquire(priority)
+        try:
+            return await request()
+        except LiebherrException as ex:
+            if is_throttled(ex):
+                self.async_throttle()
+            raise
+
+    @callback
+    def async_throttle(self, retry_after: float | None = None) -> None:
+        """Pause every lane after the cloud throttled a request."""
+        delay: float = REQUEST_THROTTLE_BACKOFF if retry_after is None else retry_after
+        _LOGGER.warning("Liebherr API is throttling, pausing requests for %.0fs", delay)
+        self.throttled += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._tokens = 0
+
+    @callback
+    def _async_schedule_pump(self, delay: float) -> None:
+        if self._handle is None:
+            self._handle = self.hass.loop.call_later(delay, self._async_pump)
+
+    @callback
+    def _async_pump(self) -> None:
+        """Hand out tokens to the waiting requests, highest priority first."""
+        self._handle = None
+        now: float = time.monotonic()
+        self._refill(now)
+        while self._waiters:
+            if now < self._blocked_until:
+                self._async_schedule_pump(self._blocked_until - now)
+                return
+            if self._tokens < 1:
+                self._async_schedule_pump((1 - self._tokens) / self.rate)
+                return
+            future: asyncio.Future[None] = heapq.heappop(self._waiters)[2]
+            if future.done():
+                # Cancelled while waiting
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the waiting requests."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        for _, _, future in self._waiters:
+            future.cancel()
+        self._waiters.clear()
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Queue depth and wait times for diagnostics."""
+        return {
+            "tokens": round(self._tokens, 2),
+            "throttled": self.throttled,
+            "blocked_for": round(max(self._blocked_until - time.monotonic(), 0), 1),
+            "lanes": {
+                priority.name.lower(): {
+                    "queue_depth": sum(
+                        1
+                        for waiter in self._waiters
+                        if waiter[0] == priority and not waiter[2].done()
+                    ),
+                    "requests": stats.requests,
+                    "average_wait": (
+                        round(stats.total_wait / stats.requests, 3)
+                        if stats.requests
+                        else 0
+                    ),
+                    "max_wait": round(stats.max_wait, 3),
+                }
+                for priority, stats in self.stats.items()
+            },
+        }
@@ -1,6 +1,7 @@
 """Support for Liebherr mode selections."""
 
 import logging
+from typing import Any
 
 from pyliebherr import LiebherrControlKey, LiebherrDevice
 from pyliebherr.const import ControlType
@@ -45,17 +46,17 @@ class LiebherrSelect(LiebherrEntity, SelectEntity):
         """Current Option."""
         return self.control.current_mode.lower() if self.control.current_mode else None
 
-    async def _async_select_option(self, data: LiebherrControlRequest) -> None:
+    async def _async_select_option(
+        self, data: LiebherrControlRequest, **values: Any
+    ) -> None:
         try:
-            await self.async_set_value(
-                data,
-            )
+            await self.async_set_optimistic(data, **values)
 
         except LiebherrException as e:
             _LOGGER.error(
                 "Failed to set option '%s' for '%s': %s",
                 data,
-                self.coordinator.device.device_id,
+                self.device.device_id,
                 e,
             )
 
@@ -87,16 +88,14 @@ class LiebherrBioFreshPlus(LiebherrSelect):
             _LOGGER.error("Invalid option selected: %s", option)
             return
 
+        mode: BioFreshPlusControlRequest.BioFreshPlusMode = (
+            BioFreshPlusControlRequest.BioFreshPlusMode(option.upper())
+        )
         data: LiebherrControlRequest = BioFreshPlusControlRequest(
             zoneId=self.control.zone_id or 0,
-            bioFreshPlusMode=BioFreshPlusControlRequest.BioFreshPlusMode(
-                option.upper()
-            ),
+            bioFreshPlusMode=mode,
         )
-        await self._async_select_option(data)
-
-        self.control.current_mode = option
-        self.async_write_ha_state()
+        await self._async_select_option(data, current_mode=mode)
 
 
 class LiebherrIceMaker(LiebherrSelect):
@@ -128,13 +127,11 @@ class LiebherrIceMaker(LiebherrSelect):
             _LOGGER.error("Invalid option selected: %s", option)
             return
 
+        mode: IceMakerControlRequest.IceMakerMode = IceMakerControlRequest.IceMakerMode(
+            option.upper()
+        )
         data: LiebherrControlRequest = IceMakerControlRequest(
             zoneId=self.control.zone_id or 0,
-            iceMakerMode=IceMakerControlRequest.IceMakerMode(option.upper()),
-        )
-
-        await self._async_select_option(data)
-        self.control.ice_maker_mode = IceMakerControlRequest.IceMakerMode(
-            option.upper()
+            iceMakerMode=mode,
         )
-        self._async_write_ha_state()
+        await self._async_select_option(data, ice_maker_mode=mode)
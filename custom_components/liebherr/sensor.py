@@ -0,0 +1,264 @@
+"""Diagnostic sensors for the Liebherr hub and appliances."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Final
+
+from pyliebherr import LiebherrDevice
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import StateType
+
+from . import LiebherrConfigEntry, LiebherrControlIndex
+from .const import (
+    DOMAIN,
+    METRICS_INTERVAL,
+    METRICS_LAST_EVENT_RESOLUTION,
+    METRICS_SIGNIFICANT_CHANGE,
+    SIGNAL_DEVICE_READY,
+)
+from .entity import async_get_device_info, async_get_unique_id
+from .metrics import LiebherrMetrics
+
+
+def _changed(previous: Any, value: Any) -> bool:
+    """Any change is significant (counts and queue depths)."""
+    return value != previous
+
+
+def _changed_relative(previous: float, value: float) -> bool:
+    """Significant if the value moved by METRICS_SIGNIFICANT_CHANGE (or 1)."""
+    return abs(value - previous) >= max(abs(previous) * METRICS_SIGNIFICANT_CHANGE, 1)
+
+
+def _changed_last_event(previous: datetime, value: datetime) -> bool:
+    """Significant if the last event advanced by METRICS_LAST_EVENT_RESOLUTION.
+
+    A healthy stream moves it every minute, a stalled stream stops moving it.
+    """
+    return value - previous >= METRICS_LAST_EVENT_RESOLUTION
+
+
+@dataclass(frozen=True, kw_only=True)
+class LiebherrMetricSensorDescription(SensorEntityDescription):
+    """Describes a metric sensor."""
+
+    hub_only: bool = False
+    # Whether a new sample differs enough from the published one to write it
+    significant: Callable[[Any, Any], bool] = _changed
+
+
+SENSORS: Final[tuple[LiebherrMetricSensorDescription, ...]] = (
+    LiebherrMetricSensorDescription(
+        key="events_per_minute",
+        translation_key="events_per_minute",
+        native_unit_of_measurement="events/min",
+        significant=_changed_relative,
+    ),
+    LiebherrMetricSensorDescription(
+        key="last_event",
+        translation_key="last_event",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        significant=_changed_last_event,
+    ),
+    LiebherrMetricSensorDescription(
+        key="reconnects",
+        translation_key="reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    LiebherrMetricSensorDescription(
+        key="command_latency_p50",
+        translation_key="command_latency_p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        significant=_changed_relative,
+    ),
+    LiebherrMetricSensorDescription(
+        key="command_latency_p95",
+        translation_key="command_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        significant=_changed_relative,
+    ),
+    LiebherrMetricSensorDescription(
+        key="command_queue_depth",
+        translation_key="command_queue_depth",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    LiebherrMetricSensorDescription(
+        key="state_writes_per_minute",
+        translation_key="state_writes_per_minute",
+        native_unit_of_measurement="writes/min",
+        significant=_changed_relative,
+    ),
+    LiebherrMetricSensorDescription(
+        key="connected_devices",
+        translation_key="connected_devices",
+        state_class=SensorStateClass.MEASUREMENT,
+        hub_only=True,
+    ),
+    LiebherrMetricSensorDescription(
+        key="request_queue_depth",
+        translation_key="request_queue_depth",
+        state_class=SensorStateClass.MEASUREMENT,
+        hub_only=True,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: LiebherrConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+):
+    """Set up Liebherr diagnostic sensors from a config entry."""
+
+    metrics: LiebherrMetrics = LiebherrMetrics(
+        config_entry.runtime_data.hub,
+        config_entry.runtime_data.reconnect,
+        config_entry.runtime_data.scheduler,
+    )
+    metrics.async_sample()
+
+    hub_device: DeviceInfo = DeviceInfo(
+        identifiers={(DOMAIN, config_entry.entry_id)},
+        name="Liebherr HomeAPI",
+        manufacturer="Liebherr",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+    entities: list[LiebherrMetricSensor] = [
+        LiebherrMetricSensor(
+            metrics,
+            description,
+            None,
+            f"{DOMAIN}_{config_entry.entry_id}_{description.key}",
+            hub_device,
+        )
+        for description in SENSORS
+    ]
+    for device in config_entry.runtime_data.devices:
+        entities.extend(_async_get_device_sensors(metrics, device))
+    async_add_entities(entities)
+
+    @callback
+    def _async_add_device(
+        device: LiebherrDevice, _controls: LiebherrControlIndex
+    ) -> None:
+        """Add the sensors of a device that reported in after setup."""
+        async_add_entities(_async_get_device_sensors(metrics, device))
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICE_READY.format(config_entry.entry_id), _async_add_device
+        )
+    )
+    config_entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            metrics.async_sample,
+            METRICS_INTERVAL,
+            name="liebherr metrics",
+            cancel_on_shutdown=True,
+        )
+    )
+
+
+@callback
+def _async_get_device_sensors(
+    metrics: LiebherrMetrics, device: LiebherrDevice
+) -> list["LiebherrMetricSensor"]:
+    """Create the metric sensors of a device."""
+    return [
+        LiebherrMetricSensor(
+            metrics,
+            description,
+            device.device_id,
+            async_get_unique_id(device.device_id, description.key),
+            async_get_device_info(device),
+        )
+        for description in SENSORS
+        if not description.hub_only
+    ]
+
+
+class LiebherrMetricSensor(SensorEntity):
+    """A metric of the hub (device_id None) or of a device.
+
+    The metrics are sampled once per METRICS_INTERVAL, but a sample is only
+    written when it differs significantly from the published state, so the
+    recorder sees few states of a steady metric. The per minute rates have
+    no state class and thus no long-term statistics. Device metrics are
+    disabled by default.
+    """
+
+    entity_description: LiebherrMetricSensorDescription
+
+    def __init__(
+        self,
+        metrics: LiebherrMetrics,
+        description: LiebherrMetricSensorDescription,
+        device_id: str | None,
+        unique_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the sensor."""
+        self.metrics: LiebherrMetrics = metrics
+        self.entity_description = description
+        self.device_id: str | None = device_id
+        self._attr_has_entity_name = True
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = device_id is None
+        self._attr_should_poll = False
+        self._attr_available = self._available
+        self._attr_native_value = self._sampled_value
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state when a sample changed significantly."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.metrics.async_add_listener(self._async_handle_sample))
+
+    @property
+    def _available(self) -> bool:
+        """Unavailable once the device was removed from the account."""
+        return self.device_id in self.metrics.values
+
+    @property
+    def _sampled_value(self) -> StateType | datetime:
+        """The latest sample."""
+        return self.metrics.values.get(self.device_id, {}).get(
+            self.entity_description.key
+        )
+
+    @callback
+    def _async_handle_sample(self) -> None:
+        available: bool = self._available
+        value: StateType | datetime = self._sampled_value
+        previous: StateType | datetime = self._attr_native_value
+        if available == self._attr_available and (
+            value == previous
+            or (
+                value is not None
+                and previous is not None
+                and not self.entity_description.significant(previous, value)
+            )
+        ):
+            return
+        self._attr_available = available
+        self._attr_native_value = value
+        self.async_write_ha_state()
@@ -0,0 +1,113 @@
+"""Hourly long-term statistics computed from the SSE stream."""
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.dt import utcnow
+from homeassistant.util.unit_conversion import TemperatureConverter
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class LiebherrHourlyStatistics:
+    """Time weighted hourly mean, min and max of a value.
+
+    Each hour is aggregated incrementally as the values arrive and imported
+    as external statistics once it is over, so the recorder does not need the
+    individual states to compile them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        statistic_id: str,
+        name: str,
+        unit_of_measurement: str,
+    ) -> None:
+        """Initialize the statistics."""
+        self.hass: HomeAssistant = hass
+        self.metadata: StatisticMetaData = StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=name,
+            source=statistic_id.split(":")[0],
+            statistic_id=statistic_id,
+            unit_class=TemperatureConverter.UNIT_CLASS,
+            unit_of_measurement=unit_of_measurement,
+        )
+        self._hour: datetime | None = None
+        self._value: float | None = None
+        self._since: datetime | None = None
+        self._weighted: float = 0
+        self._duration: float = 0
+        self._min: float | None = None
+        self._max: float | None = None
+
+    @callback
+    def async_add_value(self, value: float | None) -> None:
+        """Account for the previous value up to now, then track the new one."""
+        now: datetime = utcnow()
+        self._async_advance(now)
+        self._value = value
+        self._since = now
+        if value is not None:
+            self._min = value if self._min is None else min(self._min, value)
+            self._max = value if self._max is None else max(self._max, value)
+
+    @callback
+    def async_close_hour(self, _: datetime | None = None) -> None:
+        """Import the hour that just ended (called on the hour)."""
+        self._async_advance(utcnow())
+
+    @callback
+    def _async_advance(self, now: datetime) -> None:
+        """Accumulate the current value up to now, importing completed hours."""
+        hour: datetime = now.replace(minute=0, second=0, microsecond=0)
+        if self._hour is None or self._since is None:
+            self._hour = hour
+            return
+        while self._hour < hour:
+            end: datetime = self._hour + timedelta(hours=1)
+            self._async_accumulate(end)
+            self._async_import()
+            self._hour = end
+            self._since = end
+            self._weighted = self._duration = 0
+            self._min = self._max = self._value
+        self._async_accumulate(now)
+
+    @callback
+    def _async_accumulate(self, until: datetime) -> None:
+        if self._value is None or self._since is None or until <= self._since:
+            return
+        seconds: float = (until - self._since).total_seconds()
+        self._weighted += self._value * seconds
+        self._duration += seconds
+        self._since = until
+
+    @callback
+    def _async_import(self) -> None:
+        if not self._duration or self._hour is None:
+            return
+        if "recorder" not in self.hass.config.components:
+            _LOGGER.debug("Recorder not loaded, dropping statistics for %s", self._hour)
+            return
+        async_add_external_statistics(
+            self.hass,
+            self.metadata,
+            [
+                StatisticData(
+                    start=self._hour,
+                    mean=round(self._weighted / self._duration, 2),
+                    min=self._min,
+                    max=self._max,
+                )
+            ],
+        )
@@ -0,0 +1,84 @@
+"""Persisted snapshot of the Liebherr devices and their controls."""
+
+import logging
+from typing import Any
+
+from pyliebherr import LiebherrControl, LiebherrDevice
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+def _dump_device(device: LiebherrDevice) -> dict[str, Any]:
+    """Serialize a device, controls are stored as a list (keys are tuples).
+
+    The update_callback the hub sets on every control is not serializable.
+    """
+    data: dict[str, Any] = device.model_dump(
+        mode="json", by_alias=True, exclude={"controls"}
+    )
+    data["controls"] = [
+        control.model_dump(mode="json", by_alias=True, exclude={"update_callback"})
+        for control in device.controls.values()
+    ]
+    return data
+
+
+def _load_device(data: dict[str, Any]) -> LiebherrDevice:
+    """Restore a device serialized by _dump_device."""
+    controls: list[LiebherrControl] = [
+        LiebherrControl.model_validate(control) for control in data.pop("controls")
+    ]
+    device: LiebherrDevice = LiebherrDevice.model_validate(data)
+    device.controls = {
+        (control.control_name, control.zone_id): control for control in controls
+    }
+    return device
+
+
+class LiebherrSnapshotStore:
+    """Last known devices and controls, used to set up before the API answers."""
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        self._devices: list[LiebherrDevice] = []
+        self._save_pending: bool = False
+
+    async def async_load(self) -> list[LiebherrDevice] | None:
+        """Restore the devices from the last snapshot, if any."""
+        if not (data := await self._store.async_load()):
+            return None
+        try:
+            return [_load_device(device) for device in data["devices"]]
+        except (KeyError, ValueError) as ex:
+            _LOGGER.warning("Ignoring invalid device snapshot: %s", ex)
+            return None
+
+    @callback
+    def async_schedule_save(self, devices: list[LiebherrDevice]) -> None:
+        """Save the devices, at most once every SNAPSHOT_SAVE_DELAY seconds."""
+        self._devices = devices
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        return {
+            "devices": [
+                _dump_device(device) for device in self._devices if device.controls
+            ]
+        }
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
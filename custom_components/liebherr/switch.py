@@ -70,7 +70,7 @@ class LiebherrSwitch(LiebherrEntity, SwitchEntity):  # pyright: ignore[reportInc
         if not (config := CONFIG.get(control_name, {})):
             _LOGGER.error(
                 "Could not map set request for %s using control_name %s",
-                self.coordinator.device.device_id,
+                self.device.device_id,
                 control_name,
             )
             return
@@ -84,11 +84,7 @@ class LiebherrSwitch(LiebherrEntity, SwitchEntity):  # pyright: ignore[reportInc
                 zoneId=self.control.zone_id or 0,
             )
         )
-        await self.async_set_value(
-            control=controlrequest,
-        )
-        self.control.value = turn_on
-        self.async_write_ha_state()
+        await self.async_set_optimistic(controlrequest, value=turn_on)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
@@ -0,0 +1,95 @@
+"""Bounded event and command trace of a Liebherr appliance."""
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import time
+from typing import Any
+
+from pyliebherr import LiebherrControlKey
+
+from homeassistant.core import callback
+from homeassistant.util.dt import utcnow
+
+from .const import TRACE_SIZE
+
+
+@dataclass(slots=True)
+class LiebherrTraceEntry:
+    """An SSE event or a command, timings in milliseconds."""
+
+    time: datetime
+    kind: str
+    control: str
+    zone_id: int | None
+    # Events: time spent in the listeners, and from dispatch to the state write
+    dispatch: float | None = None
+    write: float | None = None
+    # Commands: time waiting for the device and the request budget, round trip
+    wait: float | None = None
+    duration: float | None = None
+    callers: int | None = None
+    error: str | None = None
+
+
+def _elapsed(start: float) -> float:
+    """Milliseconds since start (monotonic)."""
+    return round((time.monotonic() - start) * 1000, 1)
+
+
+class LiebherrTrace:
+    """The most recent events and commands of a device.
+
+    A ring buffer, so the memory used is bounded by TRACE_SIZE entries per
+    device regardless of uptime.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        """Initialize the trace."""
+        self.entries: deque[LiebherrTraceEntry] = deque(maxlen=size)
+
+    @callback
+    def async_add_event(
+        self, control_key: LiebherrControlKey, start: float
+    ) -> LiebherrTraceEntry:
+        """Record an event whose listeners ran since start."""
+        entry: LiebherrTraceEntry = LiebherrTraceEntry(
+            utcnow(), "event", *control_key, dispatch=_elapsed(start)
+        )
+        self.entries.append(entry)
+        return entry
+
+    @callback
+    def async_written(self, entry: LiebherrTraceEntry, start: float) -> None:
+        """The state writes of an event dispatched at start are flushed."""
+        entry.write = _elapsed(start)
+
+    @callback
+    def async_add_command(
+        self, control_key: LiebherrControlKey, callers: int
+    ) -> LiebherrTraceEntry:
+        """Record a command that is about to be sent."""
+        entry: LiebherrTraceEntry = LiebherrTraceEntry(
+            utcnow(), "command", *control_key, callers=callers
+        )
+        self.entries.append(entry)
+        return entry
+
+    @callback
+    def async_sent(
+        self,
+        entry: LiebherrTraceEntry,
+        queued: float,
+        start: float,
+        error: Exception | None = None,
+    ) -> None:
+        """The command queued at queued was sent at start and completed."""
+        entry.wait = round((start - queued) * 1000, 1)
+        entry.duration = _elapsed(start)
+        if error is not None:
+            entry.error = type(error).__name__
+
+    @callback
+    def async_as_list(self) -> list[dict[str, Any]]:
+        """The entries for diagnostics, oldest first."""
+        return [asdict(entry) for entry in self.entries]
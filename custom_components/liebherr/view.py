@@ -0,0 +1,61 @@
+"""HTTP view serving the Liebherr device images by width."""
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import (
+    KEY_AUTHENTICATED,
+    KEY_HASS,
+    HomeAssistantView,
+)
+from homeassistant.config_entries import ConfigEntryState
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .image import LiebherrImage
+
+
+class LiebherrImageView(HomeAssistantView):
+    """Serve a device image variant, i.e. ?width=128 for a dashboard tile.
+
+    Authenticates like the image proxy: a logged in user or the access token
+    of the image entity.
+    """
+
+    url = "/api/liebherr/image/{entity_id}"
+    name = "api:liebherr:image"
+    requires_auth = False
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        """Serve the image variant."""
+        image: LiebherrImage | None = None
+        for entry in request.app[KEY_HASS].config_entries.async_entries(DOMAIN):
+            if entry.state is ConfigEntryState.LOADED and (
+                image := entry.runtime_data.images.get(entity_id)
+            ):
+                break
+        if not (
+            request[KEY_AUTHENTICATED]
+            or (image and request.query.get("token") in image.access_tokens)
+        ):
+            # Same answer for unknown entities, so they cannot be enumerated
+            return web.Response(status=HTTPStatus.FORBIDDEN)
+        if image is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        try:
+            width: int = int(request.query.get("width", 0))
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        image_format: str = (
+            "webp" if "image/webp" in request.headers.get(hdrs.ACCEPT, "") else "png"
+        )
+        if (content := await image.async_image_variant(width, image_format)) is None:
+            return web.Response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+        return web.Response(
+            body=content,
+            content_type=f"image/{image_format}",
+            headers={hdrs.VARY: hdrs.ACCEPT},
+        )
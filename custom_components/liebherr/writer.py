@@ -0,0 +1,60 @@
+"""Coalesced state writes for the entities of a Liebherr appliance."""
+
+from typing import Any, Protocol
+
+from homeassistant.core import HomeAssistant, callback
+
+
+class LiebherrWritableEntity(Protocol):
+    """Entity whose state writes can be coalesced."""
+
+    last_state_signature: Any
+
+    def state_signature(self) -> Any:
+        """Everything that ends up in the state machine."""
+
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine."""
+
+
+class LiebherrStateWriter:
+    """Batches the state writes of a device into one flush per loop iteration.
+
+    A burst of control updates marks entities dirty, the flush writes every
+    dirty entity once and skips the ones whose state and attributes are
+    unchanged since their last write.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self.hass: HomeAssistant = hass
+        self.writes: int = 0
+        self.suppressed: int = 0
+        self._dirty: dict[LiebherrWritableEntity, None] = {}
+        self._scheduled: bool = False
+
+    @callback
+    def async_schedule_write(self, entity: LiebherrWritableEntity) -> None:
+        """Mark an entity dirty, it is written at the end of the iteration."""
+        self._dirty[entity] = None
+        if not self._scheduled:
+            self._scheduled = True
+            self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def async_discard(self, entity: LiebherrWritableEntity) -> None:
+        """Drop a pending write (i.e. the entity is being removed)."""
+        self._dirty.pop(entity, None)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write the dirty entities whose state changed."""
+        self._scheduled = False
+        dirty: dict[LiebherrWritableEntity, None] = self._dirty
+        self._dirty = {}
+        for entity in dirty:
+            if entity.state_signature() == entity.last_state_signature:
+                self.suppressed += 1
+                continue
+            entity.async_write_ha_state()
+            self.writes += 1
@@ -0,0 +1,65 @@
+"""Fixtures for the Liebherr tests."""
+
+from collections.abc import AsyncGenerator, Generator
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.liebherr.const import DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_API_KEY
+from homeassistant.core import HomeAssistant
+
+from .fake_homeapi import FakeHomeAPI
+
+API_KEY = "test-api-key"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def fleet_size() -> int:
+    """Number of simulated appliances, parametrize to override."""
+    return 2
+
+
+@pytest.fixture
+def homeapi(fleet_size: int) -> Generator[FakeHomeAPI]:
+    """The fake HomeAPI, every LiebherrAPI created is one of its clients."""
+    home: FakeHomeAPI = FakeHomeAPI(fleet_size)
+    with patch("custom_components.liebherr.LiebherrAPI", home.client):
+        yield home
+    home.shutdown()
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """A config entry for the test API key."""
+    entry: MockConfigEntry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Liebherr SmartDevice",
+        data={CONF_API_KEY: API_KEY},
+        unique_id=f"{DOMAIN}_{API_KEY}",
+        version=1,
+        minor_version=4,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def loaded_entry(
+    hass: HomeAssistant, homeapi: FakeHomeAPI, config_entry: MockConfigEntry
+) -> AsyncGenerator[MockConfigEntry]:
+    """The config entry set up with the fake HomeAPI, unloaded afterwards."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.LOADED
+    yield config_entry
+    if config_entry.state is ConfigEntryState.LOADED:
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,295 @@
+"""Local stand-in for the Liebherr HomeAPI.
+
+Replaces LiebherrAPI, the client the integration talks to: it lists a
+simulated fleet, streams control updates at a configurable rate, answers
+commands, and injects stream and request failures. Every client is
+tracked, so tests can count the clients (and their connection pools) left
+open.
+
+The stand-in works at the client level, so pyliebherr's HTTP and SSE
+parsing is not exercised, and the devices and controls only mimic its
+pydantic models. Test the handling of those models on the real ones (see
+test_storage).
+"""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+import time
+from typing import Any, ClassVar
+
+from pyliebherr import ControlType, LiebherrDevice
+from pyliebherr.exception import LiebherrException, LiebherrSSEException
+
+type FakeControlKey = tuple[str, int | None]
+
+
+class FakeRequestError(LiebherrException):
+    """A failed request, with the HTTP status like an aiohttp error."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Initialize the error."""
+        Exception.__init__(self, message)
+        self.message: str = message
+        self.status: int | None = status
+
+
+@dataclass
+class FakeControl:
+    """A control of a simulated appliance, shaped like LiebherrControl."""
+
+    type: ControlType
+    control_name: str
+    zone_id: int | None = None
+    zone_position: str | None = None
+    value: Any = None
+    target: int | None = None
+    min: int | None = None
+    max: int | None = None
+    unit_of_measurement: str | None = None
+    use_temp_steps: bool = False
+    temp_steps: list[int] = field(default_factory=list)
+    update_callback: Callable[[], None] | None = None
+
+    model_fields: ClassVar[dict[str, Any]]
+
+    def model_dump(
+        self, exclude: set[str] | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        """The fields of the control, like pydantic, update_callback included."""
+        return {
+            name: getattr(self, name)
+            for name in self.model_fields
+            if name not in (exclude or set())
+        }
+
+
+FakeControl.model_fields = {
+    control_field.name: control_field for control_field in fields(FakeControl)
+}
+
+
+@dataclass(eq=False)
+class FakeDevice:
+    """A simulated appliance, shaped like LiebherrDevice."""
+
+    device_id: str
+    name: str
+    model: str = "Fake Appliance"
+    image_url: str | None = None
+    device_type: LiebherrDevice.DeviceType = LiebherrDevice.DeviceType.COMBI
+    controls: dict[FakeControlKey, FakeControl] = field(default_factory=dict)
+    available: bool = False
+    reconnect_attempt: int = 0
+    error_callbacks: list[Callable[[LiebherrSSEException], None]] = field(
+        default_factory=list
+    )
+
+    def add_error_callback(
+        self, error_callback: Callable[[LiebherrSSEException], None]
+    ) -> None:
+        """Called when the stream of the device fails."""
+        self.error_callbacks.append(error_callback)
+
+    def model_dump(
+        self, exclude: set[str] | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        """The fields of the device, like pydantic."""
+        data: dict[str, Any] = {
+            "device_id": self.device_id,
+            "name": self.name,
+            "model": self.model,
+            "image_url": self.image_url,
+            "device_type": self.device_type,
+        }
+        if not exclude or "controls" not in exclude:
+            data["controls"] = [
+                control.model_dump() for control in self.controls.values()
+            ]
+        return data
+
+
+def fake_controls(temperature: int = 5) -> dict[FakeControlKey, FakeControl]:
+    """The controls of a simulated fridge: a temperature zone and a toggle."""
+    return {
+        ("temperature", 0): FakeControl(
+            ControlType.TEMPERATURE,
+            "temperature",
+            zone_id=0,
+            value=temperature,
+            target=temperature,
+            min=2,
+            max=9,
+            unit_of_measurement="°C",
+        ),
+        ("partymode", None): FakeControl(ControlType.TOGGLE, "partymode", value=False),
+    }
+
+
+class FakeHomeAPI:
+    """The cloud side: the fleet, failure injection and the clients."""
+
+    def __init__(
+        self,
+        fleet_size: int = 2,
+        event_rate: float = 0,
+        connect_delay: float = 0,
+        command_latency: float = 0,
+        controls_on_list: bool = False,
+    ) -> None:
+        """Initialize the fleet, event_rate is per device and second."""
+        self.fleet: list[str] = [f"device{index:04d}" for index in range(fleet_size)]
+        self.event_rate: float = event_rate
+        self.connect_delay: float = connect_delay
+        self.command_latency: float = command_latency
+        self.controls_on_list: bool = controls_on_list
+        self.failing_streams: set[str] = set()
+        self.failing_requests: bool = False
+        self.throttled: bool = False
+        self.clients: list[FakeLiebherrAPI] = []
+        self.commands: list[tuple[str, Any]] = []
+        self.requests: int = 0
+
+    @property
+    def open_clients(self) -> int:
+        """Clients created and not closed, each holds a connection pool."""
+        return sum(1 for client in self.clients if not client.closed)
+
+    @property
+    def open_streams(self) -> int:
+        """Streams currently running, across all clients."""
+        return sum(client.open_streams for client in self.clients)
+
+    def client(self, api_key: str, **kwargs: Any) -> "FakeLiebherrAPI":
+        """Create a client, patched in for LiebherrAPI."""
+        client: FakeLiebherrAPI = FakeLiebherrAPI(self, api_key)
+        self.clients.append(client)
+        return client
+
+    def emit(self, device_id: str) -> int:
+        """Change the temperature of a device on every open stream."""
+        return sum(client.emit(device_id) for client in self.clients)
+
+    def fail_stream(self, device_id: str) -> None:
+        """Drop the streams of a device, they fail to reconnect until healed."""
+        self.failing_streams.add(device_id)
+        for client in self.clients:
+            client.fail_stream(device_id)
+
+    def heal_stream(self, device_id: str) -> None:
+        """Let the streams of a device connect again."""
+        self.failing_streams.discard(device_id)
+
+    def request(self) -> None:
+        """Account for a REST request, failing it if requested."""
+        self.requests += 1
+        if self.throttled:
+            raise FakeRequestError("HTTP 429 Too Many Requests", 429)
+        if self.failing_requests:
+            raise FakeRequestError("HTTP 503 Service Unavailable", 503)
+
+    def shutdown(self) -> None:
+        """Cancel the streams left running by a test."""
+        for client in self.clients:
+            client.cancel_streams()
+
+
+class FakeLiebherrAPI:
+    """A client of the fake HomeAPI, replaces pyliebherr's LiebherrAPI."""
+
+    def __init__(self, home: FakeHomeAPI, api_key: str) -> None:
+        """Initialize the client."""
+        self.home: FakeHomeAPI = home
+        self.api_key: str = api_key
+        self.closed: bool = False
+        self._streams: dict[str, tuple[FakeDevice, asyncio.Task[None]]] = {}
+
+    @property
+    def open_streams(self) -> int:
+        """Streams of this client that are running."""
+        return sum(1 for _, task in self._streams.values() if not task.done())
+
+    async def async_test_key(self) -> None:
+        """Validate the API key."""
+        self.home.request()
+
+    async def async_get_devices(self) -> list[FakeDevice]:
+        """List the fleet, the controls arrive with the streams."""
+        self.home.request()
+        return [
+            FakeDevice(
+                device_id,
+                f"Fridge {device_id}",
+                controls=fake_controls() if self.home.controls_on_list else {},
+            )
+            for device_id in self.home.fleet
+        ]
+
+    async def async_set_value(self, device_id: str, request: Any) -> list[Any]:
+        """Send a command."""
+        self.home.request()
+        if self.home.command_latency:
+            await asyncio.sleep(self.home.command_latency)
+        self.home.commands.append((device_id, request))
+        return []
+
+    def start_sse(self, device: FakeDevice, delay: int = 0) -> Callable[[], None]:
+        """Start the stream of a device, returns a function to cancel it."""
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(
+            self._async_stream(device, delay)
+        )
+        self._streams[device.device_id] = (device, task)
+        return task.cancel
+
+    async def _async_stream(self, device: FakeDevice, delay: float) -> None:
+        await asyncio.sleep(delay + self.home.connect_delay)
+        if device.device_id in self.home.failing_streams:
+            self._async_fail(device)
+            return
+        device.available = True
+        if not device.controls:
+            device.controls = fake_controls()
+        if not self.home.event_rate:
+            await asyncio.Event().wait()
+        interval: float = 1 / self.home.event_rate
+        next_event: float = time.monotonic()
+        while True:
+            next_event += interval
+            await asyncio.sleep(max(next_event - time.monotonic(), 0))
+            self.emit(device.device_id)
+
+    def _async_fail(self, device: FakeDevice) -> None:
+        device.available = False
+        for error_callback in list(device.error_callbacks):
+            error_callback(LiebherrSSEException("Stream failed"))
+
+    def emit(self, device_id: str) -> int:
+        """Change the temperature of a streamed device, like an SSE event."""
+        if (stream := self._streams.get(device_id)) is None or stream[1].done():
+            return 0
+        device: FakeDevice = stream[0]
+        if (control := device.controls.get(("temperature", 0))) is None:
+            return 0
+        control.value = 4 if control.value == 5 else 5
+        if control.update_callback:
+            control.update_callback()
+        return 1
+
+    def fail_stream(self, device_id: str) -> None:
+        """Drop the stream of a device, calling its error callbacks."""
+        if (stream := self._streams.pop(device_id, None)) is None:
+            return
+        stream[1].cancel()
+        self._async_fail(stream[0])
+
+    def cancel_streams(self) -> None:
+        """Cancel every stream of the client."""
+        for _, task in self._streams.values():
+            task.cancel()
+        self._streams.clear()
+
+    async def async_close(self) -> None:
+        """Close the client and its streams."""
+        self.cancel_streams()
+        self.closed = True
+
@@ -0,0 +1,215 @@
+"""Throughput and latency benchmarks on the fake HomeAPI.
+
+Run with `pytest -m benchmark -s`, each benchmark prints its results. The
+assertions only catch gross regressions, the numbers are the output.
+"""
+
+from collections.abc import AsyncGenerator
+import statistics
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from pyliebherr import ControlType
+
+from custom_components.liebherr import (
+    CONTROL_PLATFORMS,
+    PLATFORMS,
+    LiebherrControlIndex,
+    LiebherrRuntimeData,
+    async_index_controls,
+)
+from custom_components.liebherr.const import DOMAIN
+from homeassistant.components.climate import (
+    ATTR_TEMPERATURE,
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_TEMPERATURE,
+)
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .fake_homeapi import FakeDevice, FakeHomeAPI, fake_controls
+
+pytestmark = pytest.mark.benchmark
+
+FLEET_SIZES = [1, 10, 100, 1000]
+INDEX_FLEET_SIZES = [1000, 10000]
+EVENT_ROUNDS = 20
+COMMANDS = 50
+
+
+def _report(name: str, fleet_size: int, value: float, unit: str) -> None:
+    print(f"\n{name} ({fleet_size} appliances): {value:.2f} {unit}")
+
+
+async def _async_setup(
+    hass: HomeAssistant, homeapi: FakeHomeAPI, config_entry: MockConfigEntry
+) -> float:
+    """Set up the entry, returns the seconds it took."""
+    # Controls come with the listing, so no stream has to deliver them first
+    homeapi.controls_on_list = True
+    start: float = time.perf_counter()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return time.perf_counter() - start
+
+
+@pytest.fixture
+async def runtime_data(
+    hass: HomeAssistant, homeapi: FakeHomeAPI, config_entry: MockConfigEntry
+) -> AsyncGenerator[LiebherrRuntimeData]:
+    """The runtime data of an entry set up for the fleet."""
+    await _async_setup(hass, homeapi, config_entry)
+    yield config_entry.runtime_data
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("fleet_size", FLEET_SIZES)
+async def test_setup_time(
+    hass: HomeAssistant,
+    homeapi: FakeHomeAPI,
+    config_entry: MockConfigEntry,
+    fleet_size: int,
+) -> None:
+    """Time from setup to every entity added, and the memory it took."""
+    tracemalloc.start()
+    try:
+        elapsed: float = await _async_setup(hass, homeapi, config_entry)
+        memory: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    _report("Setup time", fleet_size, elapsed * 1000, "ms")
+    _report("Memory", fleet_size, memory / fleet_size / 1024, "KiB per appliance")
+    assert len(config_entry.runtime_data.devices) == fleet_size
+    assert elapsed < 5 + 0.02 * fleet_size
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("fleet_size", [10, 100])
+async def test_platform_setup_time(
+    hass: HomeAssistant,
+    homeapi: FakeHomeAPI,
+    config_entry: MockConfigEntry,
+    fleet_size: int,
+) -> None:
+    """Setup forwarding only the needed platforms vs forwarding all of them."""
+    every_platform: set[Platform] = {
+        *PLATFORMS,
+        *CONTROL_PLATFORMS.values(),
+        Platform.LIGHT,
+    }
+    forward_all: float = 0
+    with patch(
+        "custom_components.liebherr.async_get_platforms",
+        side_effect=lambda *_: set(every_platform),
+    ):
+        # The first round imports every platform, time the second one
+        for _ in range(2):
+            forward_all = await _async_setup(hass, homeapi, config_entry)
+            assert await hass.config_entries.async_unload(config_entry.entry_id)
+            await hass.async_block_till_done()
+
+    needed: float = await _async_setup(hass, homeapi, config_entry)
+    _report("Setup forwarding all platforms", fleet_size, forward_all * 1000, "ms")
+    _report("Setup forwarding needed platforms", fleet_size, needed * 1000, "ms")
+    assert config_entry.runtime_data.platforms < every_platform
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("fleet_size", FLEET_SIZES)
+async def test_event_throughput(
+    hass: HomeAssistant,
+    homeapi: FakeHomeAPI,
+    runtime_data: LiebherrRuntimeData,
+    fleet_size: int,
+) -> None:
+    """SSE events per second through the entities to the state machine."""
+    writes: int = sum(writer.writes for writer in runtime_data.hub.writers.values())
+    events: int = 0
+    start: float = time.perf_counter()
+    for _ in range(EVENT_ROUNDS):
+        for device_id in homeapi.fleet:
+            events += homeapi.emit(device_id)
+        await hass.async_block_till_done()
+    elapsed: float = time.perf_counter() - start
+    writes = (
+        sum(writer.writes for writer in runtime_data.hub.writers.values()) - writes
+    )
+    _report("Event throughput", fleet_size, events / elapsed, "events/s")
+    _report("State writes", fleet_size, writes / events, "per event")
+    assert events == EVENT_ROUNDS * fleet_size
+    assert sum(stats.events for stats in runtime_data.hub.stats.values()) == events
+    # Each event changes the temperature, so each is written exactly once
+    assert writes == events
+
+
+@pytest.mark.parametrize("fleet_size", FLEET_SIZES)
+async def test_command_latency(
+    hass: HomeAssistant,
+    homeapi: FakeHomeAPI,
+    runtime_data: LiebherrRuntimeData,
+    fleet_size: int,
+) -> None:
+    """Round trip of a service call through the command pipeline."""
+    for commands in runtime_data.hub.commands.values():
+        # Measure the pipeline, not the debounce
+        commands.debounce = 0
+    entity_id: str | None = er.async_get(hass).async_get_entity_id(
+        CLIMATE_DOMAIN, DOMAIN, f"{DOMAIN}_{homeapi.fleet[-1]}_temperature_0"
+    )
+    assert entity_id
+    latencies: list[float] = []
+    for command in range(COMMANDS):
+        start: float = time.perf_counter()
+        await hass.services.async_call(
+            CLIMATE_DOMAIN,
+            SERVICE_SET_TEMPERATURE,
+            {ATTR_ENTITY_ID: entity_id, ATTR_TEMPERATURE: 3 + command % 5},
+            blocking=True,
+        )
+        latencies.append(time.perf_counter() - start)
+    _report(
+        "Command latency p50", fleet_size, statistics.median(latencies) * 1000, "ms"
+    )
+    _report(
+        "Command latency p95",
+        fleet_size,
+        statistics.quantiles(latencies, n=20)[-1] * 1000,
+        "ms",
+    )
+    assert len(homeapi.commands) == COMMANDS
+
+
+@pytest.mark.parametrize("fleet_size", INDEX_FLEET_SIZES)
+def test_control_index(fleet_size: int) -> None:
+    """Indexing once vs scanning every control for each platform."""
+    devices: list[FakeDevice] = [
+        FakeDevice(f"device{index:05d}", "Fridge", controls=fake_controls())
+        for index in range(fleet_size)
+    ]
+    start: float = time.perf_counter()
+    index: LiebherrControlIndex = async_index_controls(devices)
+    indexed: float = time.perf_counter() - start
+
+    # What each platform did before the index: scan the whole fleet
+    start = time.perf_counter()
+    for control_type in ControlType:
+        [
+            (device, control_key)
+            for device in devices
+            for control_key, control in device.controls.items()
+            if control.type == control_type
+        ]
+    scanned: float = time.perf_counter() - start
+
+    _report("Control index", fleet_size, indexed * 1000, "ms")
+    _report("Scan per platform", fleet_size, scanned * 1000, "ms")
+    assert len(index[ControlType.TEMPERATURE]) == fleet_size
+    assert indexed < scanned
@@ -0,0 +1,110 @@
+"""Tests for the command pipeline of an appliance."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from custom_components.liebherr.commands import LiebherrCommandQueue
+from custom_components.liebherr.scheduler import LiebherrRequestScheduler
+from custom_components.liebherr.trace import LiebherrTrace
+from homeassistant.core import HomeAssistant
+
+from .fake_homeapi import FakeHomeAPI, FakeLiebherrAPI, FakeRequestError
+
+DEVICE_ID = "device0000"
+
+
+@pytest.fixture
+def queue(hass: HomeAssistant) -> LiebherrCommandQueue:
+    """A command queue with a short debounce on a fake client."""
+    home: FakeHomeAPI = FakeHomeAPI(command_latency=0.01)
+    api: FakeLiebherrAPI = home.client("key")
+    return LiebherrCommandQueue(
+        hass,
+        api,
+        LiebherrRequestScheduler(hass),
+        DEVICE_ID,
+        LiebherrTrace(),
+        debounce=0.05,
+    )
+
+
+async def test_commands_are_coalesced(
+    hass: HomeAssistant, queue: LiebherrCommandQueue
+) -> None:
+    """Rapid commands for a control send the latest one, once, for all callers."""
+    results: list[list[Any]] = await asyncio.gather(
+        *(queue.async_send(("temperature", 0), target) for target in (3, 4, 5))
+    )
+
+    assert results == [[], [], []]
+    assert queue.api.home.commands == [(DEVICE_ID, 5)]
+    assert queue.sent == 1
+    assert queue.coalesced == 2
+    assert queue.depth == 0
+    entries: list[dict[str, Any]] = queue.trace.async_as_list()
+    assert [(entry["kind"], entry["callers"]) for entry in entries] == [
+        ("command", 3)
+    ]
+    assert entries[0]["duration"] >= 10
+
+
+async def test_commands_are_serialized(
+    hass: HomeAssistant, queue: LiebherrCommandQueue
+) -> None:
+    """Commands for different controls are sent one at a time, in order."""
+    in_flight: int = 0
+    max_in_flight: int = 0
+    sent: list[Any] = []
+
+    async def _async_set_value(device_id: str, request: Any) -> list[Any]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        sent.append(request)
+        in_flight -= 1
+        return []
+
+    queue.api.async_set_value = _async_set_value
+    await asyncio.gather(
+        queue.async_send(("temperature", 0), 4),
+        queue.async_send(("partymode", None), True),
+        queue.async_send(("supercool", 1), False),
+    )
+
+    assert max_in_flight == 1
+    assert sent == [4, True, False]
+    assert len(queue.latencies) == 3
+
+
+async def test_failure_reaches_every_caller(
+    hass: HomeAssistant, queue: LiebherrCommandQueue
+) -> None:
+    """A failed command raises for every caller it was coalesced from."""
+    queue.api.home.failing_requests = True
+    results: list[Any] = await asyncio.gather(
+        queue.async_send(("temperature", 0), 3),
+        queue.async_send(("temperature", 0), 4),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, FakeRequestError) for result in results)
+    assert queue.trace.async_as_list()[0]["error"] == "FakeRequestError"
+
+
+async def test_shutdown_cancels_pending(
+    hass: HomeAssistant, queue: LiebherrCommandQueue
+) -> None:
+    """Commands still in their debounce are cancelled, never sent."""
+    task: asyncio.Task[list[Any]] = hass.async_create_task(
+        queue.async_send(("temperature", 0), 3)
+    )
+    await asyncio.sleep(0)
+    assert queue.depth == 1
+    queue.async_shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert queue.api.home.commands == []
@@ -0,0 +1,59 @@
+"""Import time budget of the integration and its platforms."""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+# Time of the integration's own modules, Home Assistant is imported beforehand
+IMPORT_BUDGET = 0.5
+
+PLATFORMS = [
+    "climate",
+    "cover",
+    "fan",
+    "image",
+    "light",
+    "number",
+    "select",
+    "sensor",
+    "switch",
+]
+
+# Run in a fresh interpreter, so nothing is imported by other tests yet
+SCRIPT = """
+import importlib
+import json
+import sys
+import time
+
+platforms = sys.argv[1:]
+importlib.import_module("pyliebherr")
+importlib.import_module("homeassistant.helpers.entity_platform")
+for platform in platforms:
+    importlib.import_module(f"homeassistant.components.{platform}")
+before = set(sys.modules)
+start = time.perf_counter()
+importlib.import_module("custom_components.liebherr")
+for platform in platforms:
+    importlib.import_module(f"custom_components.liebherr.{platform}")
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(set(sys.modules) - before)}))
+"""
+
+
+def test_import_time() -> None:
+    """The platforms load fast and leave Pillow and the statistics API out."""
+    result: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-c", SCRIPT, *PLATFORMS],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    imported: dict = json.loads(result.stdout.splitlines()[-1])
+
+    assert imported["elapsed"] < IMPORT_BUDGET
+    assert "PIL.Image" not in imported["modules"]
+    assert "homeassistant.components.recorder.statistics" not in imported["modules"]
+    assert "custom_components.liebherr.statistics" not in imported["modules"]
@@ -0,0 +1,148 @@
+"""Tests for the setup of the Liebherr integration."""
+
+from unittest.mock import patch
+
+from pyliebherr import ControlType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.liebherr import (
+    LiebherrControlIndex,
+    async_get_platforms,
+    async_index_controls,
+)
+from custom_components.liebherr.const import (
+    CONF_PRESENTATION_LIGHT_AS_NUMBER,
+    DOMAIN,
+)
+from homeassistant.config_entries import (
+    SOURCE_REAUTH,
+    SOURCE_USER,
+    ConfigEntry,
+    ConfigEntryState,
+)
+from homeassistant.const import CONF_API_KEY, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import entity_registry as er
+
+from .conftest import API_KEY
+from .fake_homeapi import FakeDevice, FakeHomeAPI, fake_controls
+
+
+def test_index_controls() -> None:
+    """Controls are indexed by type once, devices without controls are skipped."""
+    devices: list[FakeDevice] = [
+        FakeDevice("device0", "Fridge", controls=fake_controls()),
+        FakeDevice("device1", "Fridge", controls=fake_controls()),
+        FakeDevice("device2", "Fridge"),
+    ]
+    index: LiebherrControlIndex = async_index_controls(devices)
+
+    assert set(index) == {ControlType.TEMPERATURE, ControlType.TOGGLE}
+    assert index[ControlType.TEMPERATURE] == [
+        (devices[0], ("temperature", 0)),
+        (devices[1], ("temperature", 0)),
+    ]
+    assert [device.device_id for device, _ in index[ControlType.TOGGLE]] == [
+        "device0",
+        "device1",
+    ]
+
+
+async def test_clients_are_closed(hass: HomeAssistant, homeapi: FakeHomeAPI) -> None:
+    """One client is open per loaded entry, through setup, reload and reauth."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_API_KEY: API_KEY}
+    )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    entry: ConfigEntry = result["result"]
+    assert entry.state is ConfigEntryState.LOADED
+    # The setup claimed the client validated by the flow
+    assert len(homeapi.clients) == 1
+    assert homeapi.open_clients == 1
+    assert homeapi.open_streams == len(homeapi.fleet)
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    assert homeapi.open_clients == 1
+    assert homeapi.open_streams == len(homeapi.fleet)
+
+    entry.async_start_reauth(hass)
+    await hass.async_block_till_done()
+    flows = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert [flow["context"]["source"] for flow in flows] == [SOURCE_REAUTH]
+    result = await hass.config_entries.flow.async_configure(
+        flows[0]["flow_id"], {CONF_API_KEY: "another-api-key"}
+    )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.state is ConfigEntryState.LOADED
+    assert homeapi.clients[-1].api_key == "another-api-key"
+    assert homeapi.open_clients == 1
+    assert homeapi.open_streams == len(homeapi.fleet)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert homeapi.open_clients == 0
+    assert homeapi.open_streams == 0
+
+
+async def test_failed_setup_closes_client(
+    hass: HomeAssistant, homeapi: FakeHomeAPI, config_entry: MockConfigEntry
+) -> None:
+    """A setup timing out on the first controls leaves no client or stream."""
+    homeapi.connect_delay = 60
+    with patch("custom_components.liebherr.SSE_INITIAL_TIMEOUT", 0.1):
+        assert not await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.SETUP_ERROR
+    assert len(homeapi.clients) == 1
+    assert homeapi.open_clients == 0
+    assert homeapi.open_streams == 0
+
+
+async def test_only_needed_platforms(
+    hass: HomeAssistant, loaded_entry: MockConfigEntry
+) -> None:
+    """Only the platforms of the controls found are forwarded."""
+    assert loaded_entry.runtime_data.platforms == {
+        Platform.CLIMATE,
+        Platform.IMAGE,
+        Platform.SENSOR,
+        Platform.SWITCH,
+    }
+    entity_domains: set[str] = {
+        entity.domain
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), loaded_entry.entry_id
+        )
+    }
+    assert entity_domains <= set(loaded_entry.runtime_data.platforms)
+    assert Platform.CLIMATE in entity_domains
+    assert Platform.SWITCH in entity_domains
+
+
+def test_presentation_light_platform() -> None:
+    """The presentation light is a light or a number, never both."""
+    index: LiebherrControlIndex = {ControlType.PRESENTATION_LIGHT: []}
+    as_light: MockConfigEntry = MockConfigEntry(domain=DOMAIN)
+    as_number: MockConfigEntry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_PRESENTATION_LIGHT_AS_NUMBER: True}
+    )
+
+    assert async_get_platforms(as_light, index) == {
+        Platform.IMAGE,
+        Platform.LIGHT,
+        Platform.SENSOR,
+    }
+    assert async_get_platforms(as_number, index) == {
+        Platform.IMAGE,
+        Platform.NUMBER,
+        Platform.SENSOR,
+    }
@@ -0,0 +1,171 @@
+"""Tests for reconnects and availability."""
+
+import asyncio
+from collections.abc import Callable, Generator
+import logging
+import time
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.liebherr.const import (
+    RECONNECT_STABLE_AFTER,
+    RECONNECT_WARN_ATTEMPTS,
+)
+from custom_components.liebherr.hub import LiebherrHub
+from custom_components.liebherr.reconnect import (
+    LiebherrReconnectScheduler,
+    LiebherrReconnectState,
+)
+from custom_components.liebherr.scheduler import LiebherrRequestScheduler
+from homeassistant.core import HomeAssistant
+
+from .fake_homeapi import FakeDevice, FakeHomeAPI
+
+GRACE = 0.2
+TEMPERATURE = ("temperature", 0)
+
+
+async def _async_wait_for(condition: Callable[[], bool], timeout: float = 2) -> None:
+    """Wait until the condition holds, failing after the timeout."""
+    deadline: float = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def home() -> Generator[FakeHomeAPI]:
+    """A fake HomeAPI with a single appliance."""
+    home: FakeHomeAPI = FakeHomeAPI(fleet_size=1)
+    yield home
+    home.shutdown()
+
+
+@pytest.fixture
+def hub(hass: HomeAssistant, home: FakeHomeAPI) -> Generator[LiebherrHub]:
+    """A hub with a short availability grace period."""
+    hub: LiebherrHub = LiebherrHub(
+        hass, home.client("key"), LiebherrRequestScheduler(hass), GRACE
+    )
+    yield hub
+    hub.async_shutdown()
+    hub.scheduler.async_shutdown()
+
+
+@pytest.fixture
+def reconnect(
+    hass: HomeAssistant, config_entry: MockConfigEntry, hub: LiebherrHub
+) -> Generator[LiebherrReconnectScheduler]:
+    """The reconnect scheduler of the hub, with a short backoff."""
+    reconnect: LiebherrReconnectScheduler = LiebherrReconnectScheduler(
+        hass, config_entry, hub
+    )
+    with patch.object(LiebherrReconnectScheduler, "backoff", return_value=0.05):
+        yield reconnect
+    reconnect.async_shutdown()
+
+
+async def _async_connect(
+    hub: LiebherrHub, reconnect: LiebherrReconnectScheduler
+) -> FakeDevice:
+    """Set up the appliance like async_setup_entry and wait for its controls."""
+    device: FakeDevice = (await hub.api.async_get_devices())[0]
+    hub.async_add_device(device)
+    hub.availability[device.device_id].async_add_error_callback(
+        reconnect.get_error_callback(device)
+    )
+    hub.async_start_stream(device)
+    assert await hub.async_wait_for_controls(device, 2)
+    hub.async_add_listener(device, TEMPERATURE, lambda: None)
+    return device
+
+
+async def test_reconnect_after_drop(
+    home: FakeHomeAPI, hub: LiebherrHub, reconnect: LiebherrReconnectScheduler
+) -> None:
+    """A dropped stream reconnects within the grace period, staying available."""
+    device: FakeDevice = await _async_connect(hub, reconnect)
+    home.fail_stream(device.device_id)
+    home.heal_stream(device.device_id)
+    state: LiebherrReconnectState = reconnect.states[device.device_id]
+    assert state.attempt == 1
+    assert state.connected_since is None
+
+    await _async_wait_for(lambda: device.available)
+    # The first event after the reconnect marks the stream connected
+    home.emit(device.device_id)
+    assert state.connected_since is not None
+    assert hub.stats[device.device_id].stream_starts == 2
+    stats = hub.availability[device.device_id].async_get_stats()
+    assert stats["available"]
+    assert stats["drops"] == 1
+    assert stats["outages"] == 0
+
+
+async def test_stable_stream_resets_backoff(
+    home: FakeHomeAPI, hub: LiebherrHub, reconnect: LiebherrReconnectScheduler
+) -> None:
+    """A drop after a stable connection starts the backoff over."""
+    device: FakeDevice = await _async_connect(hub, reconnect)
+    state: LiebherrReconnectState = reconnect.states[device.device_id]
+    state.attempt = 5
+    state.connected_since = time.monotonic() - RECONNECT_STABLE_AFTER
+    home.fail_stream(device.device_id)
+
+    assert state.attempt == 1
+
+
+async def test_unavailable_after_grace(
+    home: FakeHomeAPI, hub: LiebherrHub, reconnect: LiebherrReconnectScheduler
+) -> None:
+    """A stream that stays down marks the device unavailable after the grace."""
+    device: FakeDevice = await _async_connect(hub, reconnect)
+    home.fail_stream(device.device_id)
+    assert hub.availability[device.device_id].available
+
+    await _async_wait_for(lambda: not hub.availability[device.device_id].available)
+    assert hub.availability[device.device_id].outages == 1
+
+    home.heal_stream(device.device_id)
+    await _async_wait_for(lambda: device.available)
+    home.emit(device.device_id)
+    assert hub.availability[device.device_id].available
+
+
+async def test_retried_past_warning(
+    home: FakeHomeAPI,
+    hub: LiebherrHub,
+    reconnect: LiebherrReconnectScheduler,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A stream that keeps failing is retried without giving up."""
+    device: FakeDevice = await _async_connect(hub, reconnect)
+    state: LiebherrReconnectState = reconnect.states[device.device_id]
+    with caplog.at_level(logging.WARNING):
+        home.fail_stream(device.device_id)
+        await _async_wait_for(lambda: state.attempt > RECONNECT_WARN_ATTEMPTS, 5)
+
+    assert "Retrying SSE connection" in caplog.text
+    assert not hub.availability[device.device_id].available
+    home.heal_stream(device.device_id)
+    await _async_wait_for(lambda: device.available)
+    home.emit(device.device_id)
+    assert hub.availability[device.device_id].available
+
+
+async def test_removed_device_is_detached(
+    home: FakeHomeAPI, hub: LiebherrHub, reconnect: LiebherrReconnectScheduler
+) -> None:
+    """Removing a device stops its stream and ignores its later errors."""
+    device: FakeDevice = await _async_connect(hub, reconnect)
+    assert home.open_streams == 1
+    hub.async_remove_device(device.device_id)
+    reconnect.async_remove_device(device.device_id)
+
+    await _async_wait_for(lambda: home.open_streams == 0)
+    for error_callback in device.error_callbacks:
+        error_callback(Exception("late error"))
+    assert device.device_id not in reconnect.states
+    assert device.device_id not in hub.availability
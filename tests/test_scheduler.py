@@ -0,0 +1,121 @@
+"""Tests for the shared request budget."""
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.liebherr.scheduler import (
+    LiebherrRequestScheduler,
+    RequestPriority,
+    is_throttled,
+    parse_retry_after,
+)
+from homeassistant.core import HomeAssistant
+
+from .fake_homeapi import FakeRequestError
+
+
+async def test_priority_order(hass: HomeAssistant) -> None:
+    """Waiting requests are served by priority, then in arrival order."""
+    scheduler: LiebherrRequestScheduler = LiebherrRequestScheduler(
+        hass, rate=50, burst=1
+    )
+    await scheduler.async_acquire(RequestPriority.IMAGE)
+    served: list[RequestPriority] = []
+
+    async def _async_request(priority: RequestPriority) -> None:
+        await scheduler.async_acquire(priority)
+        served.append(priority)
+
+    tasks: list[asyncio.Task[None]] = [
+        hass.async_create_task(_async_request(priority))
+        for priority in (
+            RequestPriority.IMAGE,
+            RequestPriority.DISCOVERY,
+            RequestPriority.COMMAND,
+            RequestPriority.RECONNECT,
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.depth == 4
+    await asyncio.gather(*tasks)
+
+    assert served == sorted(served)
+    assert scheduler.depth == 0
+    assert scheduler.stats[RequestPriority.IMAGE].requests == 2
+
+
+async def test_burst_then_rate(hass: HomeAssistant) -> None:
+    """The burst is sent right away, the rest at the refill rate."""
+    scheduler: LiebherrRequestScheduler = LiebherrRequestScheduler(
+        hass, rate=20, burst=3
+    )
+    start: float = time.monotonic()
+    for _ in range(3):
+        await scheduler.async_acquire(RequestPriority.COMMAND)
+    assert time.monotonic() - start < 0.05
+    for _ in range(2):
+        await scheduler.async_acquire(RequestPriority.COMMAND)
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_throttle_pauses_every_lane(hass: HomeAssistant) -> None:
+    """A 429 pauses every lane until Retry-After has passed."""
+    scheduler: LiebherrRequestScheduler = LiebherrRequestScheduler(
+        hass, rate=100, burst=5
+    )
+
+    async def _async_throttled() -> None:
+        raise FakeRequestError("HTTP 429 Too Many Requests", 429)
+
+    with pytest.raises(FakeRequestError):
+        await scheduler.async_run(RequestPriority.DISCOVERY, _async_throttled)
+    assert scheduler.throttled == 1
+    assert scheduler.async_get_stats()["blocked_for"] > 0
+
+    scheduler = LiebherrRequestScheduler(hass, rate=100, burst=5)
+    scheduler.async_throttle(0.2)
+    start: float = time.monotonic()
+    await scheduler.async_acquire(RequestPriority.COMMAND)
+    assert time.monotonic() - start >= 0.19
+    scheduler.async_shutdown()
+
+
+async def test_shutdown_cancels_waiters(hass: HomeAssistant) -> None:
+    """Requests still waiting for a token are cancelled on shutdown."""
+    scheduler: LiebherrRequestScheduler = LiebherrRequestScheduler(
+        hass, rate=0.01, burst=1
+    )
+    await scheduler.async_acquire(RequestPriority.COMMAND)
+    task: asyncio.Task[None] = hass.async_create_task(
+        scheduler.async_acquire(RequestPriority.DISCOVERY)
+    )
+    await asyncio.sleep(0)
+    scheduler.async_shutdown()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.parametrize(
+    ("error", "throttled"),
+    [
+        (FakeRequestError("Request failed", 429), True),
+        (FakeRequestError("Request failed", 404), False),
+        (FakeRequestError("HTTP 429 Too Many Requests"), True),
+        (FakeRequestError("Status code: 429"), True),
+        (FakeRequestError("Device 0429-429 not found"), False),
+        (FakeRequestError("Stream of 12.429.7 closed with status 500"), False),
+    ],
+)
+def test_is_throttled(error: FakeRequestError, throttled: bool) -> None:
+    """Only a 429 status (or its reason phrase) counts as throttling."""
+    assert is_throttled(error) is throttled
+
+
+def test_parse_retry_after() -> None:
+    """Retry-After is either seconds or an HTTP date."""
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
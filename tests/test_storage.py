@@ -0,0 +1,48 @@
+"""Tests for the device snapshot."""
+
+from pyliebherr import ControlType, LiebherrControl, LiebherrDevice
+from pyliebherr.const import ZonePosition
+
+from custom_components.liebherr.storage import _dump_device, _load_device
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+
+def test_snapshot_round_trip() -> None:
+    """A device with hub callbacks on its controls survives a save and load."""
+    control: LiebherrControl = LiebherrControl.model_construct(
+        type=ControlType.TEMPERATURE,
+        control_name="temperature",
+        zone_id=0,
+        zone_position=ZonePosition.TOP,
+        value=5,
+        target=5,
+        min=2,
+        max=9,
+        unit_of_measurement="°C",
+    )
+    device: LiebherrDevice = LiebherrDevice.model_construct(
+        device_id="device0",
+        name="Fridge",
+        model="Fake Appliance",
+        image_url="https://example.com/device0.png",
+        device_type=LiebherrDevice.DeviceType.COMBI,
+        controls={("temperature", 0): control},
+    )
+    # Set by the hub for every control an entity listens to
+    control.update_callback = lambda: None
+
+    # Serialized like the Store does
+    restored: LiebherrDevice = _load_device(
+        json_loads(json_bytes(_dump_device(device)))
+    )
+
+    assert restored.device_id == "device0"
+    assert restored.name == "Fridge"
+    assert restored.device_type == LiebherrDevice.DeviceType.COMBI
+    assert list(restored.controls) == [("temperature", 0)]
+    restored_control: LiebherrControl = restored.controls[("temperature", 0)]
+    assert restored_control.type == ControlType.TEMPERATURE
+    assert restored_control.zone_position == ZonePosition.TOP
+    assert restored_control.value == 5
+    assert (restored_control.min, restored_control.max) == (2, 9)